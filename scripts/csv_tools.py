@@ -8,16 +8,19 @@ It supports both single CSV file and multi-CSV folder approaches.
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
-from okfn_iati import IatiMultiCsvConverter
 
 
 # Add the src directory to the path so we can import okfn_iati
+# (okfn_iati itself is imported by the commands, so --help stays fast)
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 
 def generate_multi_templates(output_folder: str, include_examples: bool = True):
     """Generate multiple CSV templates in a folder."""
+    from okfn_iati import IatiMultiCsvConverter
+
     converter = IatiMultiCsvConverter()
 
     print(f"Generating multi-CSV templates in folder: {output_folder}")
@@ -35,6 +38,8 @@ def generate_multi_templates(output_folder: str, include_examples: bool = True):
 
 def xml_to_csv_folder(xml_path: str, csv_folder: str):
     """Convert IATI XML file to multiple CSV files in a folder."""
+    from okfn_iati import IatiMultiCsvConverter
+
     converter = IatiMultiCsvConverter()
 
     print("Converting XML to multi-CSV folder:")
@@ -70,6 +75,8 @@ def xml_to_csv_folder(xml_path: str, csv_folder: str):
 
 def csv_folder_to_xml(csv_folder: str, xml_path: str, validate: bool = True):
     """Convert multiple CSV files in a folder to IATI XML format."""
+    from okfn_iati import IatiMultiCsvConverter
+
     converter = IatiMultiCsvConverter()
 
     print("Converting multi-CSV folder to XML:")
@@ -88,8 +95,22 @@ def csv_folder_to_xml(csv_folder: str, xml_path: str, validate: bool = True):
     return success
 
 
-def main():  # noqa: C901
-    """Main CLI interface."""
+def _run_multi_template(args) -> bool:
+    generate_multi_templates(args.output_folder, not args.no_examples)
+    return True
+
+
+def _run_xml_to_csv_folder(args) -> bool:
+    return xml_to_csv_folder(args.xml_file, args.csv_folder)
+
+
+def _run_csv_folder_to_xml(args) -> bool:
+    return csv_folder_to_xml(args.csv_folder, args.xml_file, not args.no_validate)
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once per process; its content never changes."""
     parser = argparse.ArgumentParser(
         description="IATI CSV/XML Conversion Tools",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -131,6 +152,7 @@ Examples:
     multi_template_parser.add_argument('output_folder', help='Output folder path')
     multi_template_parser.add_argument('--no-examples', action='store_true',
                                        help='Skip example data in templates')
+    multi_template_parser.set_defaults(func=_run_multi_template)
 
     # XML to CSV command
     xml_to_csv_parser = subparsers.add_parser('xml-to-csv',
@@ -143,6 +165,7 @@ Examples:
                                                  help='Convert XML to multiple CSV files')
     xml_to_folder_parser.add_argument('xml_file', help='Input XML file')
     xml_to_folder_parser.add_argument('csv_folder', help='Output CSV folder')
+    xml_to_folder_parser.set_defaults(func=_run_xml_to_csv_folder)
 
     # CSV to XML command
     csv_to_xml_parser = subparsers.add_parser('csv-to-xml',
@@ -159,34 +182,25 @@ Examples:
     folder_to_xml_parser.add_argument('xml_file', help='Output XML file')
     folder_to_xml_parser.add_argument('--no-validate', action='store_true',
                                       help='Skip XML validation')
+    folder_to_xml_parser.set_defaults(func=_run_csv_folder_to_xml)
 
+    return parser
+
+
+def main():
+    """Main CLI interface."""
+    parser = _build_parser()
     args = parser.parse_args()
 
-    if not args.command:
+    # Commands without a handler (or no command at all) only print the usage
+    run = getattr(args, 'func', None)
+    if run is None:
         parser.print_help()
         return
 
     try:
-        # Execute commands
-        if args.command == 'multi-template':
-            generate_multi_templates(
-                args.output_folder,
-                not args.no_examples
-            )
-
-        elif args.command == 'xml-to-csv-folder':
-            success = xml_to_csv_folder(args.xml_file, args.csv_folder)
-            if not success:
-                sys.exit(1)
-
-        elif args.command == 'csv-folder-to-xml':
-            success = csv_folder_to_xml(
-                args.csv_folder,
-                args.xml_file,
-                not args.no_validate
-            )
-            if not success:
-                sys.exit(1)
+        if not run(args):
+            sys.exit(1)
 
     except KeyboardInterrupt:
         print("\n⚠️  Operation cancelled by user")
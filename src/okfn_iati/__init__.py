@@ -35,15 +35,7 @@ from .validators import (
 from .xml_generator import IatiXmlGenerator
 from .multi_csv_converter import IatiMultiCsvConverter
 from .iati_schema_validator import IatiValidator
-from .organisation_xml_generator import (
-    IatiOrganisationCSVConverter,
-    IatiOrganisationXMLGenerator,
-    IatiOrganisationMultiCsvConverter,
-    OrganisationRecord,
-    OrganisationBudget,
-    OrganisationExpenditure,
-    OrganisationDocument
-)
+from . import organisation_xml_generator
 from .csv_validators import (
     CsvFolderValidator,
     CsvValidationResult, ValidationIssue, ValidationLevel, ErrorCode
@@ -105,3 +97,10 @@ __all__ = [
     'CsvFolderValidator',
     'CsvValidationResult', 'ValidationIssue', 'ValidationLevel', 'ErrorCode',
 ]
+
+
+def __getattr__(name):
+    # Organisation classes are loaded on first access, see organisation_xml_generator
+    if name in organisation_xml_generator.__all__:
+        return getattr(organisation_xml_generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
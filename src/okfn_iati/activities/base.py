@@ -5,18 +5,31 @@ This module provides the main converter class for IATI data.
 """
 
 import csv
+import json
+import logging
 import shutil
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Any, Union, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import List, Dict, Any, Tuple, Union, Optional
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from okfn_iati.data import get_data_folder
 from okfn_iati.models import Activity, Narrative, OrganizationRef, IatiActivities
 from okfn_iati.xml_generator import IatiXmlGenerator
 
 # Import extractors
 from okfn_iati.activities.process_xml.extractors import (
-    get_activity_identifier, extract_description_data,
+    stream_activities, read_root_attributes, get_activity_identifier, extract_description_data,
     extract_indicator_period_data, extract_transaction_sector_data,
     extract_country_budget_items, extract_main_activity_data,
     extract_condition_data, extract_participating_org_data,
@@ -32,9 +45,42 @@ from okfn_iati.activities.process_csv.builders import (
     build_result_with_indicators, build_country_budget_items,
     build_descriptions_from_rows, parse_activity_status,
     parse_activity_scope, add_dates_from_main_data, add_geography_from_main_data,
-    add_default_types_from_main_data, build_activity_date
+    add_default_types_from_main_data, build_activity_date, BuildCache
 )
 
+logger = logging.getLogger(__name__)
+
+
+# Template example rows and README ship as data files and are read on first use.
+_EXAMPLE_DATA_FILENAME = 'activity_template_examples.json'
+_README_TEMPLATE_FILENAME = 'activity_template_README.md'
+
+
+@lru_cache(maxsize=None)
+def _load_example_data() -> Dict[str, List[Dict[str, str]]]:
+    """Load the CSV template example rows, keyed by CSV type."""
+    with open(get_data_folder() / _EXAMPLE_DATA_FILENAME, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _load_readme_template() -> str:
+    """Load the README written next to generated CSV templates."""
+    return (get_data_folder() / _README_TEMPLATE_FILENAME).read_text(encoding='utf-8')
+
+
+def _build_activity_logged(
+    converter: "IatiMultiCsvConverter", cache: BuildCache, item: Tuple[str, Dict[str, Any]]
+) -> Activity:
+    """Build one activity, logging which one failed before re-raising (runs in pool workers)."""
+    activity_id, data = item
+    try:
+        return converter._build_activity_from_data(data, cache)
+    except Exception:
+        logger.exception("Error building activity %s", activity_id)
+        logger.debug("Data for activity %s: %s", activity_id, data)
+        raise
+
 
 class IatiMultiCsvConverter:
     """
@@ -337,6 +383,10 @@ class IatiMultiCsvConverter:
             }
         }
 
+    # Activities are built in a process pool only when there are at least this
+    # many of them; below that the pool start-up cost outweighs the gain.
+    parallel_build_threshold = 500
+
     def __init__(self):
         self.xml_generator = IatiXmlGenerator()
         # Storage latest errors and warnings in case an action failed
@@ -378,19 +428,20 @@ class IatiMultiCsvConverter:
         csv_folder.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Parse XML
-            if isinstance(xml_input, (str, Path)) and Path(xml_input).exists():
-                tree = ET.parse(xml_input)
-                root = tree.getroot()
-            else:
-                root = ET.fromstring(str(xml_input))
-
             # Initialize data collections
             data_collections = {key: [] for key in self.csv_files.keys()}
 
-            # Extract data from each activity
-            for activity_elem in root.findall('.//iati-activity'):
-                self._extract_activity_to_collections(activity_elem, data_collections)
+            # Extract data from each activity. Files are streamed so that only
+            # one activity subtree is held in memory at a time.
+            if isinstance(xml_input, (str, Path)) and Path(xml_input).exists():
+                root_attrib = read_root_attributes(xml_input)
+                for activity_elem in stream_activities(xml_input):
+                    self._extract_activity_to_collections(activity_elem, data_collections)
+            else:
+                root = ET.fromstring(str(xml_input))
+                root_attrib = root.attrib
+                for activity_elem in root.findall('.//iati-activity'):
+                    self._extract_activity_to_collections(activity_elem, data_collections)
 
             # Write each CSV file
             for csv_type, csv_config in self.csv_files.items():
@@ -399,7 +450,7 @@ class IatiMultiCsvConverter:
 
             # Extract root-level attributes
             root_attributes = {
-                'linked_data_default': root.get('linked-data-default', '')
+                'linked_data_default': root_attrib.get('linked-data-default', '')
             }
 
             # Create a summary file with root attributes
@@ -418,7 +469,8 @@ class IatiMultiCsvConverter:
         csv_folder: Union[str, Path],
         xml_output: Union[str, Path],
         validate_output: bool = True,
-        validate_csv: bool = False
+        validate_csv: bool = False,
+        workers: int = 1
     ) -> bool:
         """
         Convert multiple CSV files in a folder to IATI XML.
@@ -430,6 +482,9 @@ class IatiMultiCsvConverter:
             validate_csv: If True, run CSV-level validation before conversion.
                 When validation finds errors, conversion is aborted and
                 the error details are stored in self.latest_errors.
+            workers: Number of worker processes used to build activities when there are at
+                least parallel_build_threshold of them (default: 1, no pool). With more than
+                one, the calling script needs an ``if __name__ == "__main__":`` guard on spawn platforms.
 
         Returns:
             True if conversion was successful
@@ -468,7 +523,7 @@ class IatiMultiCsvConverter:
                     data_collections[csv_type] = []
 
             # Convert to activities
-            activities = self._build_activities_from_collections(data_collections)
+            activities = self._build_activities_from_collections(data_collections, workers=workers)
 
             # Read root attributes from summary file if it exists
             linked_data_default = None
@@ -701,25 +756,50 @@ class IatiMultiCsvConverter:
 
     def _write_csv_file(self, file_path: Path, columns: List[str], data: List[Dict[str, str]]) -> None:
         """Write data to CSV file."""
+        # Missing columns default to ''; itemgetter picks the values in column order
+        defaults = dict.fromkeys(columns, '')
+        get_values = itemgetter(*columns)
         with open(file_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-
-            for row in data:
-                # Ensure all columns are present
-                clean_row = {col: row.get(col, '') for col in columns}
-                writer.writerow(clean_row)
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(get_values({**defaults, **row}) for row in data)
 
     def _read_csv_file(self, file_path: Path) -> List[Dict[str, str]]:
         """Read data from CSV file."""
-        data = []
+        if PYARROW_AVAILABLE:
+            try:
+                return self._read_csv_file_pyarrow(file_path)
+            except pa.ArrowInvalid:
+                pass  # e.g. rows with a different number of fields; use the csv module
+
+        # DictReader already yields plain dicts, so rows are not copied again
         with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                data.append(dict(row))
-        return data
+            return list(csv.DictReader(f))
+
+    def _read_csv_file_pyarrow(self, file_path: Path) -> List[Dict[str, str]]:
+        """Read data from CSV file with pyarrow's multithreaded parser, keeping every value as text."""
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f), None)
+        if not header:
+            return []
+
+        # Name the columns from the header read above, so every column is forced to
+        # text even when the file starts with a BOM that pyarrow would strip
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(column_names=header, skip_rows=1),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False
+            )
+        )
+        return table.to_pylist()
 
-    def _build_activities_from_collections(self, data_collections: Dict[str, List[Dict]]) -> List[Activity]:
+    def _build_activities_from_collections(
+        self, data_collections: Dict[str, List[Dict]], workers: int = 1
+    ) -> List[Activity]:
         """Build Activity objects from CSV data collections."""
         activities = []
 
@@ -761,19 +841,22 @@ class IatiMultiCsvConverter:
                 if activity_id in activity_data_map:
                     activity_data_map[activity_id][csv_type].append(row)
 
-        # Build activities
-        for activity_id, data in activity_data_map.items():
-            try:
-                activity = self._build_activity_from_data(data)
-                activities.append(activity)
-            except Exception as e:
-                print(f"Error building activity {activity_id}: {e}\n\nSELF {self} {type(self)}\n\t Data: {data}")
-                raise
+        # Build activities. Each activity is independent, so large inputs can be
+        # spread across processes. Narratives and periods are shared within this
+        # build only (each pool task gets its own copy of the empty cache).
+        build = partial(_build_activity_logged, self, BuildCache())
+        if workers > 1 and len(activity_data_map) >= self.parallel_build_threshold:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                activities.extend(executor.map(build, activity_data_map.items(), chunksize=64))
+        else:
+            activities.extend(map(build, activity_data_map.items()))
 
         return activities
 
-    def _build_activity_from_data(self, data: Dict[str, Any]) -> Activity:  # noqa: C901
-        """Build an Activity object from grouped data."""
+    def _build_activity_from_data(  # noqa: C901
+        self, data: Dict[str, Any], cache: Optional[BuildCache] = None
+    ) -> Activity:
+        """Build an Activity object from grouped data, sharing result narratives and periods through cache."""
         main_data = data['main']
 
         # Parse humanitarian: "" -> None, "0" -> False, "1" -> True
@@ -931,152 +1014,20 @@ class IatiMultiCsvConverter:
             result = build_result_with_indicators(
                 result_data,
                 result_indicators,
-                result_periods
+                result_periods,
+                cache
             )
 
             activity.results.append(result)
 
-        # Add conditions_attached attribute
-        conditions_attached = main_data.get('conditions_attached', '')
-        if conditions_attached != '':
-            # Store as custom attribute on activity
-            activity.__dict__['conditions_attached'] = conditions_attached
-
-        # Store individual conditions
-        if data.get('conditions'):
-            activity.__dict__['conditions'] = data['conditions']
-
         # Add country budget items
         activity.country_budget_items = build_country_budget_items(data['country_budget_items'])
 
         return activity
 
     def _get_example_data(self, csv_type: str) -> List[Dict[str, str]]:
-        """Get example data for CSV templates."""
-        if csv_type == 'activities':
-            return [{
-                'activity_identifier': 'XM-DAC-46002-CR-2025',
-                'title': 'Rural Road Infrastructure Development Project',
-                'description': (
-                    'This project aims to improve rural connectivity and market access through the rehabilitation and '
-                    'upgrading of 150km of rural roads in southeastern Costa Rica.'
-                ),
-                'activity_status': '2',
-                'activity_scope': '4',  # National
-                'default_currency': 'USD',
-                'humanitarian': '0',
-                'hierarchy': '1',
-                'xml_lang': 'en',
-                'reporting_org_ref': 'XM-DAC-46002',
-                'reporting_org_name': 'Central American Bank for Economic Integration',
-                'reporting_org_type': '40',
-                'reporting_org_role': '1',
-                'planned_start_date': '2023-01-15',
-                'actual_start_date': '2023-02-01',
-                'planned_end_date': '2025-12-31',
-                'recipient_country_code': 'CR',
-                'recipient_country_name': 'Costa Rica',
-                'recipient_country_lang': 'es',
-                'recipient_region_code': '',
-                'recipient_region_name': '',
-                'recipient_region_lang': '',
-                'collaboration_type': '1',  # Bilateral
-                'default_flow_type': '10',  # ODA
-                'default_finance_type': '110',  # Standard grant
-                'default_aid_type': 'C01',  # Project-type interventions
-                'default_tied_status': '5'  # Untied
-            }]
-        elif csv_type == 'participating_orgs':
-            return [
-                {
-                    'activity_identifier': 'XM-DAC-46002-CR-2025',
-                    'org_ref': 'XM-DAC-46002',
-                    'org_name': 'Central American Bank for Economic Integration',
-                    'org_name_lang': 'en',
-                    'org_type': '40',
-                    'role': '1'  # Funding
-                },
-                {
-                    'activity_identifier': 'XM-DAC-46002-CR-2025',
-                    'org_ref': 'CR-MOPT',
-                    'org_name': 'Ministry of Public Works and Transportation, Costa Rica',
-                    'org_name_lang': 'es',
-                    'org_type': '10',
-                    'role': '4'  # Implementing
-                }
-            ]
-        elif csv_type == 'contact_info':
-            return [{
-                'activity_identifier': 'XM-DAC-46002-CR-2025',
-                'contact_type': '1',
-                'organisation': 'Central American Bank for Economic Integration',
-                'organisation_lang': 'en',
-                'department': 'Infrastructure Projects Division',
-                'department_lang': 'en',
-                'person_name': 'Pepe Gonzalez',
-                'person_name_lang': 'es',
-                'person_name_present': '1',
-                'job_title': 'Project Manager',
-                'job_title_lang': 'en',
-                'telephone': '++999-9999-9999',
-                'email': 'pepe@gmail.com',
-                'email_present': '1',
-                'website': 'https://www.bcie.org',
-                'mailing_address': 'Tegucigalpa M.D.C., Honduras',
-                'mailing_address_lang': 'es'
-            }]
-        elif csv_type == 'results':
-            return [{
-                'activity_identifier': 'XM-DAC-46002-CR-2025',
-                'result_ref': 'result_1',
-                'result_type': '1',  # Output
-                'aggregation_status': 'true',
-                'title': 'Improved rural road infrastructure',
-                'description': 'Rural roads rehabilitated and upgraded to improve connectivity'
-            }]
-        elif csv_type == 'descriptions':
-            return [
-                {
-                    'activity_identifier': 'XM-DAC-46002-CR-2025',
-                    'description_type': '1',
-                    'description_sequence': '1',
-                    'narrative': 'Primary activity description',
-                    'narrative_lang': 'en',
-                    'narrative_sequence': '1'
-                },
-                {
-                    'activity_identifier': 'XM-DAC-46002-CR-2025',
-                    'description_type': '2',
-                    'description_sequence': '2',
-                    'narrative': 'Secondary summary for beneficiaries',
-                    'narrative_lang': 'en',
-                    'narrative_sequence': '1'
-                }
-            ]
-        elif csv_type == 'documents':
-            return [{
-                'activity_identifier': 'XM-DAC-46002-CR-2025',
-                'url': 'https://example.org/documents/project-summary.pdf',
-                'format': 'application/pdf',
-                'title': 'Project summary',
-                'title_lang': 'en',
-                'description': 'Detailed design and financing summary',
-                'description_lang': 'en',
-                'category_code': 'A01',
-                'language_code': 'en',
-                'document_date': '2024-03-15'
-            }]
-        elif csv_type == 'country_budget_items':
-            return [{
-                'activity_identifier': 'XM-DAC-46002-CR-2025',
-                'vocabulary': '1',
-                'budget_item_code': 'CR-2025-01',
-                'budget_item_percentage': '50',
-                'description': 'Road rehabilitation',
-                'description_lang': 'en'
-            }]
-
-        return []
+        """Get example data for CSV templates (shared rows, do not mutate)."""
+        return _load_example_data().get(csv_type, [])
 
     def _create_summary_file(
         self, csv_folder: Path, data_collections: Dict[str, List[Dict]], root_attributes: Dict[str, str] = None
@@ -1084,72 +1035,29 @@ class IatiMultiCsvConverter:
         """Create a summary file with statistics and root attributes."""
         summary_path = csv_folder / 'summary.txt'
 
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write("IATI CSV Conversion Summary\n")
-            f.write("=" * 30 + "\n\n")
-            f.write(f"Conversion completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            # Write root-level attributes if provided
-            if root_attributes:
-                f.write("Root Attributes:\n")
-                for key, value in root_attributes.items():
-                    if value:  # Only write non-empty values
-                        f.write(f"  {key}: {value}\n")
-                f.write("\n")
-
-            f.write("Files created:\n")
-            for csv_type, csv_config in self.csv_files.items():
-                count = len(data_collections.get(csv_type, []))
-                f.write(f"  {csv_config['filename']}: {count} records\n")
+        parts = [
+            "IATI CSV Conversion Summary\n",
+            "=" * 30 + "\n\n",
+            f"Conversion completed: {datetime.now():%Y-%m-%d %H:%M:%S}\n\n",
+        ]
+
+        # Write root-level attributes if provided
+        if root_attributes:
+            parts.append("Root Attributes:\n")
+            # Only write non-empty values
+            parts.extend(f"  {key}: {value}\n" for key, value in root_attributes.items() if value)
+            parts.append("\n")
+
+        parts.append("Files created:\n")
+        parts.extend(
+            f"  {csv_config['filename']}: {len(data_collections.get(csv_type, []))} records\n"
+            for csv_type, csv_config in self.csv_files.items()
+        )
+        parts.append(f"\nTotal activities: {len(data_collections.get('activities', []))}\n")
 
-            f.write(f"\nTotal activities: {len(data_collections.get('activities', []))}\n")
+        summary_path.write_text("".join(parts), encoding='utf-8')
 
     def _create_readme_file(self, output_folder: Path) -> None:
         """Create a README file with instructions."""
         readme_path = output_folder / 'README.md'
-
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write("""# IATI CSV Templates
-
-This folder contains CSV templates for entering IATI activity data. Each CSV file represents a
-different aspect of IATI activities:
-
-## Files Description
-
-- **activities.csv**: Main activity information (identifier, title, description, etc.)
-- **participating_orgs.csv**: Organizations participating in activities
-- **sectors.csv**: Sector classifications for activities
-- **budgets.csv**: Budget information for activities
-- **transactions.csv**: Financial transactions
-- **locations.csv**: Geographic locations
-- **documents.csv**: Document links
-- **results.csv**: Results and outcomes
-- **indicators.csv**: Indicators for results
-- **contact_info.csv**: Contact information
-
-## Key Relationships
-
-- All files use `activity_identifier` to link data to specific activities
-- The `activity_identifier` must match between files
-- Results and indicators are linked via `result_ref`
-
-## Usage Instructions
-
-1. Start by filling out **activities.csv** with your main activity data
-2. Add related data in other CSV files using the same `activity_identifier`
-3. Use the conversion tool to generate IATI XML from these CSV files
-
-## Important Notes
-
-- The `activity_identifier` must be unique and follow IATI standards
-- Dates should be in ISO format (YYYY-MM-DD)
-- Use standard IATI code lists for codes (status, types, etc.)
-- Empty fields are allowed but required fields should be filled
-
-## Example Activity Identifier Format
-
-`{organization-identifier}-{project-code}`
-
-Example: `XM-DAC-46002-CR-2025`
-
-""")
+        readme_path.write_text(_load_readme_template(), encoding='utf-8')
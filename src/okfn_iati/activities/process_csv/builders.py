@@ -4,6 +4,9 @@ IATI CSV to XML builders module.
 This module contains all functions for building IATI model objects from CSV row data.
 """
 import logging
+import re
+from collections import defaultdict
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 from okfn_iati.models import (
@@ -16,6 +19,72 @@ from okfn_iati.enums import ActivityStatus, ActivityDateType, DocumentCategory,
 
 log = logging.getLogger(__name__)
 
+# Cheap shape check used to skip malformed dates without going through
+# ActivityDate's exception path.
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}').fullmatch
+
+_TRUE_FLAGS = frozenset(('true', '1', 'yes'))
+
+# Identical indicator period rows recur across indicators, so BuildCache
+# shares the period built for them, keyed on these columns.
+_INDICATOR_PERIOD_KEYS = (
+    'period_start', 'period_end', 'target_value', 'target_comment', 'actual_value', 'actual_comment'
+)
+
+# Transaction columns copied as-is when non-empty
+_TRANSACTION_OPTIONAL_FIELDS = ('disbursement_channel', 'flow_type', 'finance_type', 'tied_status', 'recipient_region')
+
+
+@lru_cache(maxsize=None)
+def parse_bool_flag(value: str) -> bool:
+    """Parse a CSV boolean cell ('true', '1', 'yes', any case). Cached as columns hold few distinct values."""
+    return value.lower() in _TRUE_FLAGS
+
+
+class BuildCache:
+    """
+    Narratives and indicator periods shared while building one set of activities.
+
+    Result/indicator/period text repeats a lot (boilerplate comments across
+    periods), so those narratives are shared per distinct text, and identical
+    period rows share one IndicatorPeriod. Objects handed out by one cache are
+    aliased, so treat them as read-only; builders called without a cache build
+    fresh objects.
+    """
+
+    __slots__ = ('narratives', 'indicator_periods')
+
+    def __init__(self) -> None:
+        self.narratives: Dict[str, Narrative] = {}
+        self.indicator_periods: Dict[tuple, IndicatorPeriod] = {}
+
+    def narrative(self, text: str) -> Narrative:
+        """Return a language-less Narrative for text, reusing the instance built for the same text."""
+        narrative = self.narratives.get(text)
+        if narrative is None:
+            narrative = self.narratives[text] = Narrative(text=text)
+        return narrative
+
+    def indicator_period(self, period_data: Dict[str, str]) -> IndicatorPeriod:
+        """Return the IndicatorPeriod for period_data, reusing the one built for an identical row."""
+        key = tuple(period_data.get(k) for k in _INDICATOR_PERIOD_KEYS)
+        period = self.indicator_periods.get(key)
+        if period is None:
+            period = self.indicator_periods[key] = build_indicator_period(period_data, self)
+        return period
+
+
+def _narrative(text: str, cache: Optional[BuildCache]) -> Narrative:
+    """Return the shared Narrative for text from cache, or a new one without a cache."""
+    return cache.narrative(text) if cache is not None else Narrative(text=text)
+
+
+def build_narratives(text: Optional[str], lang: Optional[str] = None) -> List[Narrative]:
+    """Build a single-narrative list, or a new empty list when there is no text nor lang."""
+    if not text and not lang:
+        return []
+    return [Narrative(text=text or '', lang=lang or None)]
+
 
 def safe_int(value: Optional[str], default: int = 0) -> int:
     """Safely convert string values to integers for ordering."""
@@ -72,7 +141,7 @@ def add_dates_from_main_data(activity: Activity, main_data: Dict[str, str]) -> N
 
     for date_field, date_type in date_mappings:
         date_value = main_data.get(date_field)
-        if date_value:
+        if date_value and _ISO_DATE_RE(date_value):
             try:
                 activity_date = ActivityDate(
                     type=date_type,
@@ -80,7 +149,7 @@ def add_dates_from_main_data(activity: Activity, main_data: Dict[str, str]) -> N
                 )
                 activity.activity_dates.append(activity_date)
             except ValueError:
-                # Skip invalid dates
+                # Skip well-formed but impossible dates (e.g. 2024-02-30)
                 continue
 
 
@@ -158,14 +227,17 @@ def build_sector(sector_data: Dict[str, str]) -> Dict[str, Any]:
         "vocabulary": sector_data.get('vocabulary', '1')
     }
 
-    if sector_data.get('vocabulary_uri'):
-        sector["vocabulary_uri"] = sector_data['vocabulary_uri']
+    vocabulary_uri = sector_data.get('vocabulary_uri')
+    if vocabulary_uri:
+        sector["vocabulary_uri"] = vocabulary_uri
 
-    if sector_data.get('percentage'):
-        sector["percentage"] = sector_data['percentage']
+    percentage = sector_data.get('percentage')
+    if percentage:
+        sector["percentage"] = percentage
 
-    if sector_data.get('sector_name'):
-        sector["narratives"] = [Narrative(text=sector_data['sector_name'])]
+    sector_name = sector_data.get('sector_name')
+    if sector_name:
+        sector["narratives"] = [Narrative(text=sector_name)]
 
     return sector
 
@@ -245,12 +317,7 @@ def build_transaction(  # noqa: C901
         transaction_args['provider_org'] = OrganizationRef(
             ref=trans_data.get('provider_org_ref', ''),
             type=trans_data.get('provider_org_type', ''),
-            narratives=[
-                Narrative(
-                    text=trans_data.get('provider_org_name', ''),
-                    lang=trans_data.get('provider_org_lang') or None
-                )
-            ] if (trans_data.get('provider_org_name') or trans_data.get('provider_org_lang')) else [],
+            narratives=build_narratives(trans_data.get('provider_org_name'), trans_data.get('provider_org_lang')),
             receiver_org_activity_id=trans_data.get('receiver_org_activity_id', ''),
         )
 
@@ -259,30 +326,20 @@ def build_transaction(  # noqa: C901
         transaction_args['receiver_org'] = OrganizationRef(
             ref=trans_data.get('receiver_org_ref', ''),
             type=trans_data.get('receiver_org_type', ''),
-            narratives=[
-                Narrative(
-                    text=trans_data.get('receiver_org_name', ''),
-                    lang=trans_data.get('receiver_org_lang') or None
-                )
-            ] if (trans_data.get('receiver_org_name') or trans_data.get('receiver_org_lang')) else [],
+            narratives=build_narratives(trans_data.get('receiver_org_name'), trans_data.get('receiver_org_lang')),
             receiver_org_activity_id=trans_data.get('receiver_org_activity_id', ''),
         )
 
     # Add optional fields
-    if trans_data.get('disbursement_channel'):
-        transaction_args['disbursement_channel'] = trans_data['disbursement_channel']
-    if trans_data.get('flow_type'):
-        transaction_args['flow_type'] = trans_data['flow_type']
-    if trans_data.get('finance_type'):
-        transaction_args['finance_type'] = trans_data['finance_type']
-    if trans_data.get('tied_status'):
-        transaction_args['tied_status'] = trans_data['tied_status']
-    if trans_data.get('aid_type'):
+    for field in _TRANSACTION_OPTIONAL_FIELDS:
+        value = trans_data.get(field)
+        if value:
+            transaction_args[field] = value
+    aid_type = trans_data.get('aid_type')
+    if aid_type:
         vocab = trans_data.get('aid_type_vocabulary') or "1"
-        transaction_args['aid_type'] = {"code": trans_data['aid_type'], "vocabulary": vocab}
+        transaction_args['aid_type'] = {"code": aid_type, "vocabulary": vocab}
         transaction_args['aid_type_vocabulary'] = vocab
-    if trans_data.get('recipient_region'):
-        transaction_args['recipient_region'] = trans_data['recipient_region']
 
     sectors = []
     if trans_sectors:
@@ -291,10 +348,12 @@ def build_transaction(  # noqa: C901
                 "code": sector_data.get('sector_code', ''),
                 "vocabulary": sector_data.get('vocabulary', '1'),
             }
-            if sector_data.get('vocabulary_uri'):
-                sector['vocabulary_uri'] = sector_data['vocabulary_uri']
-            if sector_data.get('sector_name'):
-                sector['narratives'] = [Narrative(text=sector_data['sector_name'])]
+            vocabulary_uri = sector_data.get('vocabulary_uri')
+            if vocabulary_uri:
+                sector['vocabulary_uri'] = vocabulary_uri
+            sector_name = sector_data.get('sector_name')
+            if sector_name:
+                sector['narratives'] = [Narrative(text=sector_name)]
             sectors.append(sector)
     transaction_args['sectors'] = sectors
 
@@ -414,99 +473,107 @@ def build_contact_info(contact_data: Dict[str, str]) -> ContactInfo:
 def build_result_with_indicators(
     result_data: Dict[str, str],
     indicators_data: List[Dict[str, str]],
-    periods_data: List[Dict[str, str]]
+    periods_data: List[Dict[str, str]],
+    cache: Optional[BuildCache] = None
 ) -> Result:
-    """Build Result with its indicators and periods."""
-    result_args = {
-        'type': result_data.get('result_type', '1')
-    }
-
-    if result_data.get('title'):
-        result_args['title'] = [Narrative(text=result_data['title'])]
-
-    if result_data.get('description'):
-        result_args['description'] = [Narrative(text=result_data['description'])]
+    """Build Result with its indicators and periods, sharing narratives and periods through cache when one is given."""
+    get = result_data.get
+    title = get('title')
+    description = get('description')
+    aggregation_status = get('aggregation_status')
 
-    if result_data.get('aggregation_status'):
-        result_args['aggregation_status'] = result_data['aggregation_status'].lower() in ('true', '1', 'yes')
+    # Bucket periods by indicator so each indicator does a single lookup
+    periods_by_ref = defaultdict(list)
+    for period_data in periods_data:
+        periods_by_ref[period_data.get('indicator_ref')].append(period_data)
 
     # BUILD INDICATORS FOR THIS RESULT
     indicators = []
     for indicator_data in indicators_data:
-        indicator = build_indicator(indicator_data)
+        indicator = build_indicator(indicator_data, cache)
 
         # Add periods to this indicator
-        indicator_ref = indicator_data.get('indicator_ref', '')
-        for period_data in periods_data:
-            if period_data.get('indicator_ref') == indicator_ref:
-                period = build_indicator_period(period_data)
-                if indicator.period is None:
-                    indicator.period = []
-                indicator.period.append(period)
+        indicator_periods = periods_by_ref.get(indicator_data.get('indicator_ref', ''))
+        if indicator_periods:
+            build_period = cache.indicator_period if cache is not None else build_indicator_period
+            indicator.period = [build_period(period_data) for period_data in indicator_periods]
 
         indicators.append(indicator)
 
-    result_args['indicator'] = indicators
-    return Result(**result_args)
-
-
-def build_indicator(indicator_data: Dict[str, str]) -> Indicator:
-    """Build Indicator from data."""
-    indicator_args = {
-        'measure': indicator_data.get('indicator_measure', '1')
-    }
-
-    if indicator_data.get('title'):
-        indicator_args['title'] = [Narrative(text=indicator_data['title'])]
-
-    if indicator_data.get('description'):
-        indicator_args['description'] = [Narrative(text=indicator_data['description'])]
+    return Result(
+        type=get('result_type', '1'),
+        aggregation_status=parse_bool_flag(aggregation_status) if aggregation_status else None,
+        title=[_narrative(title, cache)] if title else None,
+        description=[_narrative(description, cache)] if description else None,
+        indicator=indicators
+    )
 
-    if indicator_data.get('ascending'):
-        indicator_args['ascending'] = indicator_data['ascending'].lower() in ('true', '1', 'yes')
 
-    if indicator_data.get('aggregation_status'):
-        indicator_args['aggregation_status'] = indicator_data['aggregation_status'].lower() in ('true', '1', 'yes')
+def build_indicator(indicator_data: Dict[str, str], cache: Optional[BuildCache] = None) -> Indicator:
+    """Build Indicator from data, sharing its narratives through cache when one is given."""
+    get = indicator_data.get
+    title = get('title')
+    description = get('description')
+    ascending = get('ascending')
+    aggregation_status = get('aggregation_status')
 
     # Add baseline if present
-    if indicator_data.get('baseline_year'):
+    # Non-numeric years are skipped up front instead of through int()'s
+    # exception; the try still covers an invalid baseline_iso_date.
+    baseline = None
+    baseline_year = get('baseline_year')
+    if baseline_year and baseline_year.strip().lstrip('-').isdigit():
         try:
             baseline = IndicatorBaseline(
-                year=int(indicator_data['baseline_year']),
-                iso_date=indicator_data.get('baseline_iso_date'),
-                value=indicator_data.get('baseline_value')
+                year=int(baseline_year),
+                iso_date=get('baseline_iso_date'),
+                value=get('baseline_value')
             )
-            if indicator_data.get('baseline_comment'):
-                baseline.comment = [Narrative(text=indicator_data['baseline_comment'])]
-            indicator_args['baseline'] = [baseline]
+            baseline_comment = get('baseline_comment')
+            if baseline_comment:
+                baseline.comment = [_narrative(baseline_comment, cache)]
         except (ValueError, TypeError):
             pass  # Skip invalid baseline data
 
-    return Indicator(**indicator_args)
+    return Indicator(
+        measure=get('indicator_measure', '1'),
+        title=[_narrative(title, cache)] if title else [],
+        description=[_narrative(description, cache)] if description else None,
+        ascending=parse_bool_flag(ascending) if ascending else None,
+        aggregation_status=parse_bool_flag(aggregation_status) if aggregation_status else None,
+        baseline=[baseline] if baseline is not None else None
+    )
 
 
-def build_indicator_period(period_data: Dict[str, str]) -> IndicatorPeriod:
-    """Build IndicatorPeriod from data."""
-    period_args = {
-        'period_start': period_data.get('period_start', ''),
-        'period_end': period_data.get('period_end', '')
-    }
+def build_indicator_period(period_data: Dict[str, str], cache: Optional[BuildCache] = None) -> IndicatorPeriod:
+    """Build IndicatorPeriod from data, sharing its comment narratives through cache when one is given."""
+    get = period_data.get
 
-    # Add target if present
-    if period_data.get('target_value'):
-        target = IndicatorPeriodTarget(value=period_data['target_value'])
-        if period_data.get('target_comment'):
-            target.comment = [Narrative(text=period_data['target_comment'])]
-        period_args['target'] = [target]
-
-    # Add actual if present
-    if period_data.get('actual_value'):
-        actual = IndicatorPeriodActual(value=period_data['actual_value'])
-        if period_data.get('actual_comment'):
-            actual.comment = [Narrative(text=period_data['actual_comment'])]
-        period_args['actual'] = [actual]
-
-    return IndicatorPeriod(**period_args)
+    # Period rows are often sparse: target/actual are only built when a value is set
+    target = None
+    target_value = get('target_value')
+    if target_value:
+        target_comment = get('target_comment')
+        target = [IndicatorPeriodTarget(
+            value=target_value,
+            comment=[_narrative(target_comment, cache)] if target_comment else None
+        )]
+
+    actual = None
+    actual_value = get('actual_value')
+    if actual_value:
+        actual_comment = get('actual_comment')
+        actual = [IndicatorPeriodActual(
+            value=actual_value,
+            comment=[_narrative(actual_comment, cache)] if actual_comment else None
+        )]
+
+    return IndicatorPeriod(
+        period_start=get('period_start', ''),
+        period_end=get('period_end', ''),
+        target=target,
+        actual=actual
+    )
 
 
 def build_country_budget_items(rows: List[Dict[str, str]]) -> List[Dict[str, Any]]:
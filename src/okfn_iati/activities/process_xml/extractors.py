@@ -7,7 +7,8 @@ into CSV row dictionaries.
 
 import xml.etree.ElementTree as ET
 import html
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import Iterator, List, Dict, Optional, Union
 
 
 def get_text_content(element: Optional[ET.Element]) -> str:
@@ -17,6 +18,26 @@ def get_text_content(element: Optional[ET.Element]) -> str:
     return html.unescape(element.text)
 
 
+def stream_activities(xml_path: Union[str, Path]) -> Iterator[ET.Element]:
+    """
+    Stream iati-activity elements from an XML file.
+
+    Each activity is cleared once the caller is done with it, so memory use is
+    bounded by the largest activity rather than by the document size.
+    """
+    for _, elem in ET.iterparse(str(xml_path), events=('end',)):
+        if elem.tag == 'iati-activity':
+            yield elem
+            elem.clear()
+
+
+def read_root_attributes(xml_path: Union[str, Path]) -> Dict[str, str]:
+    """Read the attributes of the root element without parsing the whole file."""
+    for _, elem in ET.iterparse(str(xml_path), events=('start',)):
+        return dict(elem.attrib)
+    return {}
+
+
 def get_activity_identifier(activity_elem: ET.Element) -> str:
     """Get activity identifier from XML element."""
     id_elem = activity_elem.find('iati-identifier')
@@ -395,16 +416,8 @@ def extract_transaction_data(trans_elem: ET.Element, activity_id: str) -> Dict[s
         data['receiver_org_activity_id'] = ''
         data['receiver_org_lang'] = ''
 
-    # Additional fields
-    data['disbursement_channel'] = ''
-    data['flow_type'] = ''
-    data['finance_type'] = ''
-    data['aid_type'] = ''
-    data['aid_type_vocabulary'] = ''
-    data['tied_status'] = ''
-    data['recipient_region'] = ''
-
-    # Extract additional transaction elements
+    # Additional transaction elements. Only set when present; missing columns
+    # are filled with '' when the CSV is written.
     disbursement_elem = trans_elem.find('disbursement-channel')
     if disbursement_elem is not None:
         data['disbursement_channel'] = disbursement_elem.get('code', '')
@@ -446,9 +459,6 @@ def extract_location_data(location_elem: ET.Element, activity_id: str) -> Dict[s
     if loc_id_elem is not None:
         data['location_id_vocabulary'] = loc_id_elem.get('vocabulary', '')
         data['location_id_code'] = loc_id_elem.get('code', '')
-    else:
-        data['location_id_vocabulary'] = ''
-        data['location_id_code'] = ''
 
     # Names and descriptions
     name_elem = location_elem.find('name/narrative')
@@ -463,19 +473,14 @@ def extract_location_data(location_elem: ET.Element, activity_id: str) -> Dict[s
     data['activity_description'] = get_text_content(activity_desc_elem)
     data['activity_description_lang'] = activity_desc_elem.get(xml_lang, '') if activity_desc_elem is not None else ''
 
-    # Coordinates
+    # Coordinates (like location-id and administrative, only set when present;
+    # missing columns are filled with '' when the CSV is written)
     point_elem = location_elem.find('point/pos')
     if point_elem is not None and point_elem.text:
         coords = get_text_content(point_elem).split()
         if len(coords) >= 2:
             data['latitude'] = coords[0]
             data['longitude'] = coords[1]
-        else:
-            data['latitude'] = ''
-            data['longitude'] = ''
-    else:
-        data['latitude'] = ''
-        data['longitude'] = ''
 
     # Additional location attributes
     data['exactness'] = location_elem.get('exactness', '')
@@ -489,11 +494,6 @@ def extract_location_data(location_elem: ET.Element, activity_id: str) -> Dict[s
         data['administrative_level'] = admin_elem.get('level', '')
         data['administrative_code'] = admin_elem.get('code', '')
         data['administrative_country'] = admin_elem.get('country', '')
-    else:
-        data['administrative_vocabulary'] = ''
-        data['administrative_level'] = ''
-        data['administrative_code'] = ''
-        data['administrative_country'] = ''
 
     return data
 
@@ -554,8 +554,13 @@ def extract_indicator_data(
     result_ref: str,
     indicator_index: int = 1
 ) -> Dict[str, str]:
-    """Extract indicator data."""
-    indicator_ref = f'indicator_{activity_id}_{result_ref}_{indicator_index}'
+    """Extract indicator data.
+
+    ``indicator_ref`` only has to be unique within its activity, since
+    ``activity_identifier`` is stored alongside it, so the activity id is
+    not repeated in the reference.
+    """
+    indicator_ref = f'{result_ref}_{indicator_index}'
 
     data = {
         'activity_identifier': activity_id,
@@ -1,6 +1,8 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, FrozenSet, Union
 
 from okfn_iati.enums import (
     ActivityStatus, ActivityScope, BudgetStatus, BudgetType,
@@ -15,8 +17,18 @@ from okfn_iati.enums import (
 )
 from okfn_iati.validators import crs_channel_code_validator
 
+# Models built in large numbers per conversion (narratives, results and their
+# indicators) use __slots__ where dataclasses support it (Python 3.10+).
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def _enum_values(enum_cls: type) -> FrozenSet[Any]:
+    """Return the set of values of an enum class, built once per class for membership checks."""
+    return frozenset(e.value for e in enum_cls)
+
+
+@dataclass(**_SLOTS)
 class Narrative:
     """
     Narrative element for multilingual text content.
@@ -142,7 +154,7 @@ class ActivityDate:
             except (StopIteration, ValueError):
                 valid_types = [e.value for e in ActivityDateType]
                 errors.append(f"Invalid date type: {self.type}. Valid values are: {valid_types}")
-        elif hasattr(self.type, 'value') and self.type.value not in [e.value for e in ActivityDateType]:
+        elif hasattr(self.type, 'value') and self.type.value not in _enum_values(ActivityDateType):
             valid_types = [e.value for e in ActivityDateType]
             errors.append(f"Invalid date type: {self.type}. Valid values are: {valid_types}")
 
@@ -348,7 +360,7 @@ class Budget:
                 self.type = next(e for e in BudgetType if e.value == self.type)
             except (StopIteration, ValueError):
                 pass
-        elif hasattr(self.type, 'value') and self.type.value not in [e.value for e in BudgetType]:
+        elif hasattr(self.type, 'value') and self.type.value not in _enum_values(BudgetType):
             raise ValueError(f"Invalid budget type: {self.type}. Valid values are: {[e.value for e in BudgetType]}")
 
         if isinstance(self.status, str):
@@ -356,7 +368,7 @@ class Budget:
                 self.status = next(e for e in BudgetStatus if e.value == self.status)
             except (StopIteration, ValueError):
                 pass
-        elif hasattr(self.status, 'value') and self.status.value not in [e.value for e in BudgetStatus]:
+        elif hasattr(self.status, 'value') and self.status.value not in _enum_values(BudgetStatus):
             raise ValueError(f"Invalid budget status: {self.status}. Valid values are: {[e.value for e in BudgetStatus]}")
 
         # Validate ISO date formats
@@ -438,7 +450,7 @@ class Transaction:
                 self.type = next(e for e in TransactionType if e.value == self.type)
             except (StopIteration, ValueError):
                 pass
-        elif hasattr(self.type, 'value') and self.type.value not in [e.value for e in TransactionType]:
+        elif hasattr(self.type, 'value') and self.type.value not in _enum_values(TransactionType):
             raise ValueError(f"Invalid transaction type: {self.type}. Valid values are: {[e.value for e in TransactionType]}")
 
         if isinstance(self.flow_type, str) and self.flow_type is not None:
@@ -446,7 +458,7 @@ class Transaction:
                 self.flow_type = next(e for e in FlowType if e.value == self.flow_type)
             except (StopIteration, ValueError):
                 pass
-        elif hasattr(self.flow_type, 'value') and self.flow_type.value not in [e.value for e in FlowType]:
+        elif hasattr(self.flow_type, 'value') and self.flow_type.value not in _enum_values(FlowType):
             raise ValueError(f"Invalid flow type: {self.flow_type}. Valid values are: {[e.value for e in FlowType]}")
 
         if isinstance(self.finance_type, str) and self.finance_type is not None:
@@ -454,12 +466,12 @@ class Transaction:
                 self.finance_type = next(e for e in FinanceType if e.value == self.finance_type)
             except (StopIteration, ValueError):
                 pass
-        elif hasattr(self.finance_type, 'value') and self.finance_type.value not in [e.value for e in FinanceType]:
+        elif hasattr(self.finance_type, 'value') and self.finance_type.value not in _enum_values(FinanceType):
             raise ValueError(f"Invalid finance type: {self.finance_type}. Valid values are: {[e.value for e in FinanceType]}")
 
         # Validate aid_type_vocabulary if provided
         if self.aid_type_vocabulary is not None and self.aid_type_vocabulary != "":
-            if self.aid_type_vocabulary not in [e.value for e in AidTypeVocabulary]:
+            if self.aid_type_vocabulary not in _enum_values(AidTypeVocabulary):
                 error = (
                     f"Invalid aid type vocabulary: {self.aid_type_vocabulary}. "
                     f"Valid values are: {[e.value for e in AidTypeVocabulary]}"
@@ -486,7 +498,7 @@ class Transaction:
                 self.tied_status = next(e for e in TiedStatus if e.value == self.tied_status)
             except (StopIteration, ValueError):
                 pass
-        elif hasattr(self.tied_status, 'value') and self.tied_status.value not in [e.value for e in TiedStatus]:
+        elif hasattr(self.tied_status, 'value') and self.tied_status.value not in _enum_values(TiedStatus):
             raise ValueError(f"Invalid tied status: {self.tied_status}. Valid values are: {[e.value for e in TiedStatus]}")
 
         # Validate disbursement channel
@@ -525,7 +537,7 @@ class Transaction:
                 raise ValueError(f"Invalid value_date format: {self.value_date}. Expected YYYY-MM-DD")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class IndicatorBaseline:
     """
     Baseline information for an indicator.
@@ -557,7 +569,7 @@ class IndicatorBaseline:
                 raise ValueError(f"Invalid ISO date format: {self.iso_date}. Expected YYYY-MM-DD")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class IndicatorPeriodTarget:
     """
     Target information for an indicator period.
@@ -577,7 +589,7 @@ class IndicatorPeriodTarget:
     dimension: Optional[List[Dict[str, str]]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class IndicatorPeriodActual:
     """
     Actual result information for an indicator period.
@@ -597,7 +609,7 @@ class IndicatorPeriodActual:
     dimension: Optional[List[Dict[str, str]]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class IndicatorPeriod:
     """
     Period information for an indicator.
@@ -629,7 +641,7 @@ class IndicatorPeriod:
             raise ValueError(f"Invalid period_end format: {self.period_end}. Expected YYYY-MM-DD")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Indicator:
     """
     Indicator information for results.
@@ -667,12 +679,12 @@ class Indicator:
             except (StopIteration, ValueError):
                 valid_measures = [e.value for e in IndicatorMeasure]
                 raise ValueError(f"Invalid indicator measure: {self.measure}. Valid values are: {valid_measures}")
-        elif hasattr(self.measure, 'value') and self.measure.value not in [e.value for e in IndicatorMeasure]:
+        elif hasattr(self.measure, 'value') and self.measure.value not in _enum_values(IndicatorMeasure):
             valid_measures = [e.value for e in IndicatorMeasure]
             raise ValueError(f"Invalid indicator measure: {self.measure}. Valid values are: {valid_measures}")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Result:
     """
     Results information for the activity.
@@ -702,7 +714,7 @@ class Result:
                 self.type = next(e for e in ResultType if e.value == self.type)
             except (StopIteration, ValueError):
                 pass
-        elif hasattr(self.type, 'value') and self.type.value not in [e.value for e in ResultType]:
+        elif hasattr(self.type, 'value') and self.type.value not in _enum_values(ResultType):
             raise ValueError(f"Invalid result type: {self.type}. Valid values are: {[e.value for e in ResultType]}")
 
 
@@ -810,7 +822,7 @@ class Activity:
         # Validate default_aid_type_vocabulary if provided
         if self.default_aid_type_vocabulary is not None:
             # Check is in AidTypeVocabulary
-            if self.default_aid_type_vocabulary not in [e.value for e in AidTypeVocabulary]:
+            if self.default_aid_type_vocabulary not in _enum_values(AidTypeVocabulary):
                 raise ValueError(
                     f"Invalid default_aid_type_vocabulary: {self.default_aid_type_vocabulary}. "
                     f"Valid values are: {[e.value for e in AidTypeVocabulary]}"
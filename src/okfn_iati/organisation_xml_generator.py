@@ -14,16 +14,18 @@ New imports are recommended:
     from okfn_iati.organisations import IatiOrganisationMultiCsvConverter
 """
 
-# Re-export main classes from new location for backward compatibility
-from okfn_iati.organisations import (
-    IatiOrganisationXMLGenerator,
-    IatiOrganisationCSVConverter,
-    IatiOrganisationMultiCsvConverter,
-    OrganisationRecord,
-    OrganisationBudget,
-    OrganisationExpenditure,
-    OrganisationDocument
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from okfn_iati.organisations import (
+        IatiOrganisationXMLGenerator,
+        IatiOrganisationCSVConverter,
+        IatiOrganisationMultiCsvConverter,
+        OrganisationRecord,
+        OrganisationBudget,
+        OrganisationExpenditure,
+        OrganisationDocument
+    )
 
 __all__ = [
     "IatiOrganisationXMLGenerator",
@@ -34,3 +36,18 @@ __all__ = [
     "OrganisationExpenditure",
     "OrganisationDocument"
 ]
+
+
+def __getattr__(name):
+    # Re-export main classes from the new location on first access (PEP 562),
+    # so importing this module does not load the organisations subpackage.
+    if name in __all__:
+        from okfn_iati import organisations
+        value = getattr(organisations, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,19 +8,24 @@ Main classes:
     - IatiOrganisationMultiCsvConverter: Convert between multi-CSV and organisation XML
     - OrganisationRecord: Data model for organisation information
     - OrganisationBudget: Data model for organisation budget
+    - OrganisationBudgetLine: Data model for budget and expense lines
     - OrganisationExpenditure: Data model for organisation expenditure
     - OrganisationDocument: Data model for organisation document
 """
 
-from .base import (
-    IatiOrganisationXMLGenerator,
-    IatiOrganisationCSVConverter,
-    IatiOrganisationMultiCsvConverter,
-    OrganisationRecord,
-    OrganisationBudget,
-    OrganisationExpenditure,
-    OrganisationDocument
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import (
+        IatiOrganisationXMLGenerator,
+        IatiOrganisationCSVConverter,
+        IatiOrganisationMultiCsvConverter,
+        OrganisationRecord,
+        OrganisationBudget,
+        OrganisationBudgetLine,
+        OrganisationExpenditure,
+        OrganisationDocument
+    )
 
 __all__ = [
     "IatiOrganisationXMLGenerator",
@@ -28,6 +33,22 @@ __all__ = [
     "IatiOrganisationMultiCsvConverter",
     "OrganisationRecord",
     "OrganisationBudget",
+    "OrganisationBudgetLine",
     "OrganisationExpenditure",
     "OrganisationDocument"
 ]
+
+
+def __getattr__(name):
+    # Load .base (generator, converters and lxml) on first access (PEP 562),
+    # so importing the package alone stays cheap.
+    if name in __all__:
+        from . import base
+        value = getattr(base, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
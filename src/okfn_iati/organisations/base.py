@@ -5,19 +5,24 @@ Main converter class for organisations with multi-CSV support.
 """
 
 import csv
+import hashlib
+import importlib.util
+import io
 import logging
-from dataclasses import dataclass, field
+import os
+import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, partial
+from itertools import zip_longest
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
-from datetime import datetime, timezone
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from typing import Optional, List, Dict, Any, Iterable, Sequence, TextIO, Tuple, Union
+from datetime import date, datetime, timezone
 
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
+from lxml import etree
 
 from .process_xml.extractors import (
     extract_organisation_basic_info,
@@ -32,56 +37,560 @@ from .process_csv.builders import (
     build_organisation_document
 )
 
+# Excel support is optional and only imported once an Excel file is read, see
+# _load_pandas and _read_first_row_xlsx, so CSV-only use doesn't pay for it
+OPENPYXL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+# Likewise for pyarrow, only needed by IatiOrganisationMultiCsvConverter.xml_to_parquet_folder
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
 # Use the legacy module name for backward compatibility with existing tests
 logger = logging.getLogger("okfn_iati.organisation_xml_generator")
 
+# Spreadsheet spellings accepted for a total budget row
+_TOTAL_BUDGET_KINDS = frozenset(("total", "total-budget", "total budget"))
+
+# Record types are built per CSV row; use __slots__ where dataclasses support it (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Characters dropped from money values typed into spreadsheets, see _to_iati_decimal
+_MONEY_NOISE = str.maketrans("", "", "$€£ \u00a0")
+_THOUSANDS_RE = re.compile(r"-?\d{1,3}(,\d{3})+(\.\d+)?\Z")
+_DECIMAL_RE = re.compile(r"-?\d+(\.\d+)?\Z")
+
+# Columns written by IatiOrganisationCSVConverter.generate_template
+_TEMPLATE_COLUMNS = (
+    # Basic organisation info
+    "Organisation Identifier",
+    "Name",
+    "Reporting Org Ref",
+    "Reporting Org Type",
+    "Reporting Org Name",
+
+    # Budget info
+    "Budget Kind",
+    "Budget Status",
+    "Budget Period Start",
+    "Budget Period End",
+    "Budget Value",
+    "Currency",
+    "Value Date",
+
+    # Recipient info
+    "Recipient Org Ref",
+    "Recipient Org Type",
+    "Recipient Org Name",
+    "Recipient Country Code",
+    "Recipient Region Code",
+    "Recipient Region Vocabulary",
+
+    # Document info
+    "Document URL",
+    "Document Format",
+    "Document Title",
+    "Document Category",
+    "Document Language",
+    "Document Date",
+
+    # Expenditure info
+    "Expenditure Period Start",
+    "Expenditure Period End",
+    "Expenditure Value",
+    "Expenditure Currency",
+)
+
+# Example row for the template, one value per _TEMPLATE_COLUMNS entry
+_TEMPLATE_EXAMPLE_ROW = (
+    "XM-DAC-46002",  # Organisation Identifier
+    "Sample Organisation",  # Name
+    "XM-DAC-46002",  # Reporting Org Ref
+    "40",  # Reporting Org Type
+    "Sample Organisation",  # Reporting Org Name
+    "total-budget",  # Budget Kind
+    "2",  # Budget Status
+    "2025-01-01",  # Budget Period Start
+    "2025-12-31",  # Budget Period End
+    "1000000",  # Budget Value
+    "USD",  # Currency
+    "2025-01-01",  # Value Date
+    "",  # Recipient Org Ref
+    "",  # Recipient Org Type
+    "",  # Recipient Org Name
+    "",  # Recipient Country Code
+    "",  # Recipient Region Code
+    "",  # Recipient Region Vocabulary
+    "https://example.org/annual-report",  # Document URL
+    "text/html",  # Document Format
+    "Annual Report",  # Document Title
+    "A01",  # Document Category
+    "en",  # Document Language
+    "2025-01-01",  # Document Date
+    "2025-01-01",  # Expenditure Period Start
+    "2025-12-31",  # Expenditure Period End
+    "950000",  # Expenditure Value
+    "USD",  # Expenditure Currency
+)
+
+# The template never changes and none of its values needs quoting, so its CSV
+# lines are encoded once here (test_template_bytes_match_csv_writer checks this)
+_TEMPLATE_HEADER_BYTES = (",".join(_TEMPLATE_COLUMNS) + "\r\n").encode("utf-8")
+_TEMPLATE_EXAMPLE_BYTES = (",".join(_TEMPLATE_EXAMPLE_ROW) + "\r\n").encode("utf-8")
+
+# O_BINARY keeps Windows from translating the CRLF line endings again
+_TEMPLATE_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Columns of each file of IatiOrganisationMultiCsvConverter (see csv_files)
+_ORGANISATIONS_COLUMNS = (
+    'organisation_identifier', 'name', 'reporting_org_ref',
+    'reporting_org_type', 'reporting_org_name', 'reporting_org_lang',
+    'default_currency', 'xml_lang',
+)
+_NAMES_COLUMNS = ('organisation_identifier', 'language', 'name')
+_BUDGETS_COLUMNS = (
+    'organisation_identifier', 'budget_kind', 'budget_status',
+    'period_start', 'period_end', 'value', 'currency', 'value_date',
+    'recipient_org_ref', 'recipient_org_type', 'recipient_org_name',
+    'recipient_country_code', 'recipient_region_code', 'recipient_region_vocabulary',
+)
+_EXPENDITURES_COLUMNS = (
+    'organisation_identifier', 'period_start', 'period_end',
+    'value', 'currency', 'value_date',
+)
+_DOCUMENTS_COLUMNS = (
+    'organisation_identifier', 'url', 'format', 'title',
+    'category_code', 'language', 'document_date',
+)
+
+# Identifier and low-cardinality code columns whose values repeat across rows;
+# _parse_csv_rows interns them so each distinct value is stored once
+_INTERNED_CSV_COLUMNS = frozenset({
+    'organisation_identifier', 'reporting_org_type', 'reporting_org_lang',
+    'default_currency', 'xml_lang', 'language', 'budget_kind', 'budget_status',
+    'currency', 'recipient_org_type', 'recipient_region_vocabulary', 'format', 'category_code',
+})
+
+# Example rows written by IatiOrganisationMultiCsvConverter.generate_csv_templates
+_MULTI_CSV_EXAMPLE_ROWS = {
+    'organisations': (
+        ('XM-DAC-46002', 'Sample Organisation', 'XM-DAC-46002',
+         '40', 'Sample Organisation', 'en', 'USD', 'en'),
+    ),
+    'names': (
+        ('XM-DAC-46002', '', 'Central American Bank for Economic Integration'),
+        ('XM-DAC-46002', 'es', 'Banco Centroamericano de Integración Económica'),
+    ),
+    'budgets': (
+        ('XM-DAC-46002', 'total-budget', '2',
+         '2025-01-01', '2025-12-31', '1000000', 'USD', '2025-01-01',
+         '', '', '', '', '', ''),
+    ),
+    'expenditures': (
+        ('XM-DAC-46002', '2024-01-01', '2024-12-31',
+         '950000', 'USD', '2024-01-01'),
+    ),
+    'documents': (
+        ('XM-DAC-46002', 'https://example.org/annual-report.pdf',
+         'application/pdf', 'Annual Report 2024', 'A01', 'en', '2025-01-01'),
+    ),
+}
+
+# Buffer size for XML and CSV data files: rows and elements are written in many
+# small pieces, flush them to disk in large blocks
+_WRITE_BUFFER_SIZE = 1 << 20
+
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+_ROOT_NSMAP = {
+    "xsd": "http://www.w3.org/2001/XMLSchema",
+    "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+}
+
+# Budget element names allowed for OrganisationBudget.kind
+_VALID_BUDGET_KINDS = frozenset((
+    'total-budget',
+    'recipient-org-budget',
+    'recipient-country-budget',
+    'recipient-region-budget'
+))
+
+
+def _stripped(value: Any) -> str:
+    """Strip a value as text; values read from rows are already str, so skip the str() call for them."""
+    try:
+        return value.strip()
+    except AttributeError:
+        return str(value).strip()
+
+
+def _set_attribute(element: etree._Element, name: str, value: Any) -> None:
+    """Set XML attribute if value is not None or empty (``xml:lang`` is mapped to its namespace)."""
+    if value is None:
+        return
+    value = _stripped(value)
+    if value:
+        element.set(_XML_LANG if name == "xml:lang" else name, value)
+
+
+def _set_attribute_str(element: etree._Element, name: str, value: Optional[str]) -> None:
+    """Set XML attribute from a string the generator produced itself, which needs no cleaning."""
+    if value:
+        element.set(name, value)
 
-def _set_attribute(element: ET.Element, name: str, value: Any) -> None:
-    """Set XML attribute if value is not None or empty."""
-    if value is not None and str(value).strip():
-        element.set(name, str(value).strip())
+
+# XML attribute names for the _sub keywords that differ from them
+_SUB_ATTRIBUTE_NAMES = {"iso_date": "iso-date", "value_date": "value-date"}
+
+
+def _sub(parent: etree._Element, tag: str, **attrs: Any) -> etree._Element:
+    """Create a child element in place, setting attributes via ``_set_attribute``.
+
+    Keyword names use underscores for hyphens (``iso_date`` -> ``iso-date``, see
+    _SUB_ATTRIBUTE_NAMES). Children are always created with ``SubElement`` rather
+    than ``Element`` + ``append``, which lxml handles quadratically on large trees.
+    """
+    element = etree.SubElement(parent, tag)
+    attribute_names = _SUB_ATTRIBUTE_NAMES
+    for name, value in attrs.items():
+        _set_attribute(element, attribute_names.get(name, name), value)
+    return element
 
 
-def _add_narrative(parent: ET.Element, text: str, lang: Optional[str] = None) -> None:
+def _add_narrative(parent: etree._Element, text: str, lang: Optional[str] = None) -> None:
     """Add a narrative element with optional language attribute."""
-    if not text or not str(text).strip():
+    if not text:
         return
+    text = _stripped(text)
+    if not text:
+        return
+
+    narr = etree.SubElement(parent, "narrative")
+    narr.text = text
+
+    if lang:
+        _set_attribute(narr, "xml:lang", lang)
+
+
+def _normalize_keys(row: Dict[str, str]) -> Dict[str, str]:
+    """Lower-case and strip column names so fields can be looked up case-insensitively."""
+    return {k.lower().strip(): v for k, v in row.items()}
+
+
+def _map_fields(row: Dict[str, str], field_aliases: Dict[str, Tuple[str, int]]) -> Dict[str, str]:
+    """
+    Map a row's columns to field names in a single pass over the row.
+
+    field_aliases maps each normalized column alias to its field name and its
+    position in that field's alias list. A field takes the value of its earliest
+    alias that has one; fields without a value are left out.
+
+    Rows come from _read_first_row, which already turns None/NaN into "" and strips values.
+    """
+    fields: Dict[str, str] = {}
+    ranks: Dict[str, int] = {}
+    for column, value in _normalize_keys(row).items():
+        if not value:
+            continue
+        alias = field_aliases.get(column)
+        if alias is None:
+            continue
+        field_name, rank = alias
+        if rank < ranks.get(field_name, rank + 1):
+            fields[field_name] = value
+            ranks[field_name] = rank
+
+    return fields
+
+
+def _to_iati_decimal(value: str) -> str:
+    """
+    Clean a spreadsheet money value such as "$1,500,000.00" into an xsd:decimal.
+
+    Values that are still not a plain decimal after removing currency symbols,
+    thousands separators and spaces are returned unchanged.
+    """
+    cleaned = value.translate(_MONEY_NOISE)
+    if _THOUSANDS_RE.match(cleaned):
+        cleaned = cleaned.replace(",", "")
+    return cleaned if _DECIMAL_RE.match(cleaned) else value
+
+
+class _IatiCsvDialect(csv.excel):
+    """CSV format of every organisation file written here (excel settings, CRLF rows)."""
+    delimiter = ","
+    quotechar = '"'
+    quoting = csv.QUOTE_MINIMAL
+    lineterminator = "\r\n"
+
+
+def _write_csv_rows(file_path: Path, rows: Iterable[Sequence[str]]) -> None:
+    """Render CSV rows in memory and write them to file_path with a single write() call."""
+    buffer = io.StringIO()
+    csv.writer(buffer, dialect=_IatiCsvDialect).writerows(rows)
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        f.write(buffer.getvalue())
+
 
-    narr = ET.SubElement(parent, "narrative")
-    narr.text = str(text).strip()
+@lru_cache(maxsize=None)
+def _load_pandas() -> Any:
+    """Import pandas on first use; None when it is not installed."""
+    try:
+        import pandas
+    except ImportError:
+        return None
+    return pandas
 
-    if lang and str(lang).strip():
-        narr.set("xml:lang", str(lang).strip())
 
+def __getattr__(name: str) -> Any:
+    # PANDAS_AVAILABLE was a module constant before pandas became a lazy import;
+    # it is still answered (importing pandas) for code that checks it
+    if name == "PANDAS_AVAILABLE":
+        return _load_pandas() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def _get_field(row: Dict[str, Any], field_names: List[str], default: str = "") -> str:
-    """Get field value from row by trying multiple possible field names."""
-    row_lower = {k.lower().strip(): v for k, v in row.items()}
 
-    for name in field_names:
-        key = name.lower().strip()
-        if key in row_lower:
-            value = row_lower[key]
-            if value is None:
-                return default
+class _LazyCsvWriter:
+    """
+    Write row dicts as CSV with fixed columns, creating the file only once there is something to write.
+
+    Rows go through csv.writer as plain lists, taking each column with dict.get;
+    like csv.DictWriter, missing keys are written as empty cells.
+    """
+
+    def __init__(self, stack: ExitStack, file_path: Path, fieldnames: Sequence[str]) -> None:
+        self._stack = stack
+        self._file_path = file_path
+        self._fieldnames = fieldnames
+        self._writer: Any = None
+
+    @property
+    def opened(self) -> bool:
+        """Whether the file has been created."""
+        return self._writer is not None
+
+    def open(self) -> None:
+        """Create the file and write the header, if not done yet."""
+        if self._writer is None:
+            f = self._stack.enter_context(
+                open(self._file_path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE)
+            )
+            self._writer = csv.writer(f, dialect=_IatiCsvDialect)
+            self._writer.writerow(self._fieldnames)
+
+    def writerows(self, rows: List[Dict[str, str]]) -> None:
+        """Write rows, creating the file on the first non-empty call."""
+        if rows:
+            self.open()
+            fieldnames = self._fieldnames
+            self._writer.writerows([list(map(row.get, fieldnames)) for row in rows])
+
+
+def _parquet_float(value: Optional[str]) -> Optional[float]:
+    """Convert an extracted money value to a float column value (empty -> null)."""
+    return float(value) if value else None
+
+
+def _parquet_date(value: Optional[str]) -> Optional[date]:
+    """Convert an extracted ISO date (or datetime) to a date column value (empty -> null)."""
+    return date.fromisoformat(value[:10]) if value else None
 
-            if PANDAS_AVAILABLE and pd.isna(value):
-                return default
 
-            value_str = str(value).strip()
-            if value_str:
-                return value_str
+# Converters and pyarrow type names for the typed Parquet columns; other columns are strings
+_PARQUET_COLUMN_TYPES = {
+    'value': (_parquet_float, 'float64'),
+    'period_start': (_parquet_date, 'date32'),
+    'period_end': (_parquet_date, 'date32'),
+    'value_date': (_parquet_date, 'date32'),
+    'document_date': (_parquet_date, 'date32'),
+}
 
-    return default
 
+class _ParquetTableWriter:
+    """
+    Collect row dicts into record batches and write them to a Parquet file once there are rows.
+
+    Values that do not parse for a typed column are written as null, with a message in warnings.
+    """
+
+    def __init__(
+        self, file_path: Path, columns: Sequence[str], batch_size: int, compression: str, warnings: List[str]
+    ) -> None:
+        import pyarrow as pa
+
+        self._pa = pa
+        self._file_path = file_path
+        self._warnings = warnings
+        self._columns = columns
+        self._batch_size = batch_size
+        self._compression = compression
+        self._schema = pa.schema([
+            (name, getattr(pa, _PARQUET_COLUMN_TYPES[name][1])() if name in _PARQUET_COLUMN_TYPES else pa.string())
+            for name in columns
+        ])
+        self._converters = [(name, _PARQUET_COLUMN_TYPES[name][0]) for name in columns if name in _PARQUET_COLUMN_TYPES]
+        self._rows: List[Dict[str, Any]] = []
+        self._writer: Any = None
+
+    def writerows(self, rows: List[Dict[str, str]]) -> None:
+        """Queue rows, writing a record batch every batch_size rows."""
+        converters = self._converters
+        for row in rows:
+            row = dict(row)
+            for name, convert in converters:
+                value = row.get(name)
+                try:
+                    row[name] = convert(value)
+                except ValueError:
+                    row[name] = None
+                    warning_msg = (
+                        f"Wrote null for unparseable {name} {value!r} of organisation "
+                        f"{row.get('organisation_identifier')} in {self._file_path.name}"
+                    )
+                    self._warnings.append(warning_msg)
+                    logger.warning(warning_msg)
+            self._rows.append(row)
+        if len(self._rows) >= self._batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        if self._writer is None:
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(self._file_path, self._schema, compression=self._compression)
+        self._writer.write_batch(self._pa.RecordBatch.from_pylist(self._rows, schema=self._schema))
+        self._rows = []
+
+    def close(self, always: bool = False) -> None:
+        """Write the remaining rows; with always, create the file even when there were none."""
+        self._flush()
+        if self._writer is None and always:
+            import pyarrow.parquet as pq
+
+            pq.write_table(self._schema.empty_table(), self._file_path, compression=self._compression)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+# Header and rows of a parsed CSV file, as tuples so a cached value cannot be changed
+_ParsedCsv = Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...]]
+
+
+def _read_csv_dicts(
+    csv_path: Path, cache: Optional[Dict[str, Tuple[bytes, _ParsedCsv]]] = None
+) -> List[Dict[str, str]]:
+    """
+    Read a CSV file into one dict per row, as list(csv.DictReader(f)) would.
+
+    When a cache dict is given, the parsed file is kept in it and reused while
+    the file content stays the same, so converting the same folder again only
+    rebuilds the dicts. Each call gets fresh dicts, so callers may change them.
+    A missing file reads as no rows.
+    """
+    try:
+        if cache is None:
+            with open(csv_path, 'r', encoding='utf-8') as f:
+                header, rows = _parse_csv_rows(f)
+        else:
+            header, rows = _read_csv_rows_cached(csv_path, cache)
+    except FileNotFoundError:
+        return []
 
-def _pretty_xml(element: ET.Element) -> str:
-    """Convert an XML Element to a pretty-printed string."""
-    rough_string = ET.tostring(element, "utf-8")
-    return minidom.parseString(rough_string).toprettyxml(indent="  ")
+    width = len(header)
+    return [
+        dict(zip(header, row)) if len(row) == width else _ragged_csv_dict(header, row)
+        for row in rows
+    ]
 
 
-@dataclass
+def _read_csv_rows_cached(csv_path: Path, cache: Dict[str, Tuple[bytes, _ParsedCsv]]) -> _ParsedCsv:
+    """Parse a CSV file, reusing the entry in cache when the file has the same content digest."""
+    data = Path(csv_path).read_bytes()
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    key = os.fspath(csv_path)
+    cached = cache.get(key)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+
+    # Decode exactly like open(csv_path, 'r', encoding='utf-8') would
+    parsed = _parse_csv_rows(io.TextIOWrapper(io.BytesIO(data), encoding='utf-8'))
+    cache[key] = (digest, parsed)
+    return parsed
+
+
+def _parse_csv_rows(f: TextIO) -> _ParsedCsv:
+    """
+    Parse an open CSV file into its header and rows.
+
+    Values in _INTERNED_CSV_COLUMNS are interned, so repeated identifiers and codes share one string.
+    """
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return (), ()
+    interned = [i for i, column in enumerate(header) if column in _INTERNED_CSV_COLUMNS]
+    rows = []
+    # Blank lines are skipped, like DictReader does
+    for row in reader:
+        if not row:
+            continue
+        for i in interned:
+            if i < len(row):
+                row[i] = sys.intern(row[i])
+        rows.append(tuple(row))
+    return tuple(header), tuple(rows)
+
+
+def _ragged_csv_dict(header: Sequence[str], row: Sequence[str]) -> Dict[Optional[str], Any]:
+    """Map a row with too few or too many cells the way csv.DictReader does."""
+    values: Dict[Optional[str], Any] = dict(zip(header, row))
+    if len(row) > len(header):
+        values[None] = list(row[len(header):])
+    else:
+        for key in header[len(row):]:
+            values[key] = None
+    return values
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time in IATI datetime format."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _xml_header() -> str:
+    """XML declaration and generator comment written before the root element."""
+    repo_url = "https://github.com/okfn/okfn-iati"
+    comment = f"<!-- Generated by OKFN-IATI Organisation XML Generator: {repo_url} -->"
+    return '<?xml version="1.0" ?>\n' + comment + "\n"
+
+
+@dataclass(**_SLOTS)
+class OrganisationBudgetLine:
+    """A budget-line or expense-line breaking down an organisation budget or expenditure."""
+    ref: str = ""
+    value: Optional[str] = None
+    currency: Optional[str] = None
+    value_date: Optional[str] = None
+    narrative: Optional[str] = None
+    lang: str = ""
+
+
+_BUDGET_LINE_FIELDS = frozenset(f.name for f in fields(OrganisationBudgetLine))
+
+
+def _budget_line_from_dict(line: Dict[str, str]) -> OrganisationBudgetLine:
+    """Build a budget/expense line from a plain dict, keeping its values as given."""
+    # Keys that are not OrganisationBudgetLine fields are ignored, as they were when lines were plain dicts
+    return OrganisationBudgetLine(**{key: value for key, value in line.items() if key in _BUDGET_LINE_FIELDS})
+
+
+def _budget_lines(lines: List[Union[OrganisationBudgetLine, Dict[str, str]]]) -> List[OrganisationBudgetLine]:
+    """Accept budget/expense lines given as plain dicts for backward compatibility."""
+    if not any(isinstance(line, dict) for line in lines):
+        return lines
+    return [_budget_line_from_dict(line) if isinstance(line, dict) else line for line in lines]
+
+
+@dataclass(**_SLOTS)
 class OrganisationBudget:
     """Budget information for an IATI organisation."""
     kind: str
@@ -97,21 +606,16 @@ class OrganisationBudget:
     recipient_country_code: Optional[str] = None
     recipient_region_code: Optional[str] = None
     recipient_region_vocabulary: Optional[str] = None
-    budget_lines: List[Dict[str, str]] = field(default_factory=list)
+    budget_lines: List[OrganisationBudgetLine] = field(default_factory=list)
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Validate budget kind."""
-        valid_kinds = [
-            'total-budget',
-            'recipient-org-budget',
-            'recipient-country-budget',
-            'recipient-region-budget'
-        ]
-        if self.kind not in valid_kinds:
+        if self.kind not in _VALID_BUDGET_KINDS:
             raise ValueError(f"Invalid budget kind: {self.kind}")
+        self.budget_lines = _budget_lines(self.budget_lines)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OrganisationExpenditure:
     """Expenditure information for an IATI organisation."""
     period_start: str
@@ -119,10 +623,14 @@ class OrganisationExpenditure:
     value: str
     currency: Optional[str] = None
     value_date: Optional[str] = None
-    expense_lines: List[Dict[str, str]] = field(default_factory=list)
+    expense_lines: List[OrganisationBudgetLine] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        """Normalise expense lines."""
+        self.expense_lines = _budget_lines(self.expense_lines)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OrganisationDocument:
     """Document link information for an IATI organisation."""
     url: str
@@ -133,7 +641,7 @@ class OrganisationDocument:
     document_date: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OrganisationRecord:
     """IATI Organisation record containing all organisation information."""
     org_identifier: str
@@ -149,68 +657,71 @@ class OrganisationRecord:
     expenditures: List[OrganisationExpenditure] = field(default_factory=list)
     documents: List[OrganisationDocument] = field(default_factory=list)
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Validate required fields."""
         if not self.org_identifier:
             raise ValueError("Missing required field: org_identifier")
         if not self.name:
             raise ValueError("Missing required field: name")
 
-        if not self.names:
-            self.names = {"": self.name}
-        elif "" not in self.names and (not self.xml_lang or self.xml_lang not in self.names):
-            self.names[""] = self.name
-
 
 class IatiOrganisationXMLGenerator:
     """Generator for IATI organisation XML files."""
 
-    def __init__(self, iati_version: str = "2.03"):
+    def __init__(self, iati_version: str = "2.03") -> None:
         """Initialize the XML generator."""
         self.iati_version = iati_version
+        # Set once per document by build_root_element and reused for every organisation
+        self._generated_datetime: Optional[str] = None
+
+    def build_root_element(self, generation_time: Optional[str] = None) -> etree._Element:
+        """
+        Create the root iati-organisations element.
 
-    def build_root_element(self) -> ET.Element:
-        """Create the root iati-organisations element."""
-        root = ET.Element("iati-organisations")
+        Args:
+            generation_time: IATI datetime for generated-datetime and every
+                organisation's last-updated-datetime (default: now, in UTC)
+        """
+        root = etree.Element("iati-organisations", nsmap=_ROOT_NSMAP)
         _set_attribute(root, "version", self.iati_version)
-        _set_attribute(
-            root, "generated-datetime",
-            datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        )
-        _set_attribute(root, "xmlns:xsd", "http://www.w3.org/2001/XMLSchema")
-        _set_attribute(
-            root, "xmlns:xsi",
-            "http://www.w3.org/2001/XMLSchema-instance"
-        )
+        self._generated_datetime = generation_time or _utc_timestamp()
+        _set_attribute_str(root, "generated-datetime", self._generated_datetime)
         return root
 
-    def add_organisation(self, root: ET.Element, record: OrganisationRecord) -> ET.Element:
+    def add_organisation(self, root: etree._Element, record: OrganisationRecord) -> etree._Element:
         """Add an organisation to the XML root element."""
-        org_el = ET.SubElement(root, "iati-organisation")
-        _set_attribute(
-            org_el, "last-updated-datetime",
-            datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        )
-        _set_attribute(org_el, "xml:lang", record.xml_lang or "en")
+        # Local aliases for the helpers called per element (this runs once per organisation)
+        SubElement = etree.SubElement
+        set_attr = _set_attribute
+        add_narr = _add_narrative
+
+        # Without build_root_element, the first organisation fixes the timestamp for the rest
+        if self._generated_datetime is None:
+            self._generated_datetime = _utc_timestamp()
+
+        org_el = SubElement(root, "iati-organisation")
+        _set_attribute_str(org_el, "last-updated-datetime", self._generated_datetime)
+        set_attr(org_el, "xml:lang", record.xml_lang or "en")
 
         if record.default_currency:
-            _set_attribute(org_el, "default-currency", record.default_currency)
+            set_attr(org_el, "default-currency", record.default_currency)
 
-        oid = ET.SubElement(org_el, "organisation-identifier")
+        oid = SubElement(org_el, "organisation-identifier")
         oid.text = record.org_identifier
 
-        name_el = ET.SubElement(org_el, "name")
-        if record.names:
-            for lang_code, name_text in record.names.items():
-                _add_narrative(name_el, name_text, lang_code if lang_code else None)
-        else:
-            _add_narrative(name_el, record.name)
+        name_el = SubElement(org_el, "name")
+        names = record.names
+        for lang_code, name_text in names.items():
+            add_narr(name_el, name_text, lang_code if lang_code else None)
+        # The plain name is the default-language narrative unless names already covers it
+        if "" not in names and (not record.xml_lang or record.xml_lang not in names):
+            add_narr(name_el, record.name)
 
         if record.reporting_org_ref or record.reporting_org_type or record.reporting_org_name:
-            rep_org = ET.SubElement(org_el, "reporting-org")
-            _set_attribute(rep_org, "ref", record.reporting_org_ref)
-            _set_attribute(rep_org, "type", record.reporting_org_type)
-            _add_narrative(rep_org, record.reporting_org_name, record.reporting_org_lang)
+            rep_org = SubElement(org_el, "reporting-org")
+            set_attr(rep_org, "ref", record.reporting_org_ref)
+            set_attr(rep_org, "type", record.reporting_org_type)
+            add_narr(rep_org, record.reporting_org_name, record.reporting_org_lang)
 
         for budget in record.budgets:
             self._add_budget(org_el, budget)
@@ -223,101 +734,179 @@ class IatiOrganisationXMLGenerator:
 
         return org_el
 
-    def _add_budget(self, org_el: ET.Element, budget: OrganisationBudget) -> None:
+    def add_organisations(self, root: etree._Element, records: Iterable[OrganisationRecord]) -> List[etree._Element]:
+        """Add several organisations to the XML root element, sharing the document timestamp."""
+        add_organisation = self.add_organisation
+        return [add_organisation(root, record) for record in records]
+
+    def _add_budget(self, org_el: etree._Element, budget: OrganisationBudget) -> None:
         """Add a budget element to the organisation."""
-        budget_el = ET.SubElement(org_el, budget.kind)
-        _set_attribute(budget_el, "status", budget.status)
+        budget_el = _sub(org_el, budget.kind, status=budget.status)
 
         if budget.kind == "recipient-org-budget" and budget.recipient_org_ref:
-            recip_org = ET.SubElement(budget_el, "recipient-org")
-            _set_attribute(recip_org, "ref", budget.recipient_org_ref)
-            _set_attribute(recip_org, "type", budget.recipient_org_type)
+            recip_org = _sub(
+                budget_el, "recipient-org", ref=budget.recipient_org_ref, type=budget.recipient_org_type
+            )
             _add_narrative(recip_org, budget.recipient_org_name)
 
         elif budget.kind == "recipient-country-budget" and budget.recipient_country_code:
-            recip_country = ET.SubElement(budget_el, "recipient-country")
-            _set_attribute(recip_country, "code", budget.recipient_country_code)
+            _sub(budget_el, "recipient-country", code=budget.recipient_country_code)
 
         elif budget.kind == "recipient-region-budget" and budget.recipient_region_code:
-            recip_region = ET.SubElement(budget_el, "recipient-region")
-            _set_attribute(recip_region, "code", budget.recipient_region_code)
-            _set_attribute(recip_region, "vocabulary", budget.recipient_region_vocabulary or "1")
+            _sub(
+                budget_el, "recipient-region",
+                code=budget.recipient_region_code, vocabulary=budget.recipient_region_vocabulary or "1"
+            )
 
         if budget.period_start:
-            period_start = ET.SubElement(budget_el, "period-start")
-            _set_attribute(period_start, "iso-date", budget.period_start)
+            _sub(budget_el, "period-start", iso_date=budget.period_start)
 
         if budget.period_end:
-            period_end = ET.SubElement(budget_el, "period-end")
-            _set_attribute(period_end, "iso-date", budget.period_end)
+            _sub(budget_el, "period-end", iso_date=budget.period_end)
 
         if budget.value:
-            value_el = ET.SubElement(budget_el, "value")
+            value_el = _sub(
+                budget_el, "value",
+                currency=budget.currency, value_date=budget.value_date or budget.period_start
+            )
             value_el.text = str(budget.value)
-            _set_attribute(value_el, "currency", budget.currency)
-            _set_attribute(value_el, "value-date", budget.value_date or budget.period_start)
 
-        for line in budget.budget_lines:
-            if "value" in line:
-                pass
-
-    def _add_expenditure(self, org_el: ET.Element, expenditure: OrganisationExpenditure) -> None:
+    def _add_expenditure(self, org_el: etree._Element, expenditure: OrganisationExpenditure) -> None:
         """Add a total-expenditure element to the organisation."""
-        exp_el = ET.SubElement(org_el, "total-expenditure")
-
-        period_start = ET.SubElement(exp_el, "period-start")
-        _set_attribute(period_start, "iso-date", expenditure.period_start)
-
-        period_end = ET.SubElement(exp_el, "period-end")
-        _set_attribute(period_end, "iso-date", expenditure.period_end)
+        exp_el = _sub(org_el, "total-expenditure")
+        _sub(exp_el, "period-start", iso_date=expenditure.period_start)
+        _sub(exp_el, "period-end", iso_date=expenditure.period_end)
 
-        value_el = ET.SubElement(exp_el, "value")
+        value_el = _sub(
+            exp_el, "value",
+            currency=expenditure.currency, value_date=expenditure.value_date or expenditure.period_start
+        )
         value_el.text = str(expenditure.value)
-        _set_attribute(value_el, "currency", expenditure.currency)
-        _set_attribute(value_el, "value-date", expenditure.value_date or expenditure.period_start)
-
-        for line in expenditure.expense_lines:
-            if "value" in line:
-                pass
 
-    def _add_document_link(self, org_el: ET.Element, document: OrganisationDocument) -> None:
+    def _add_document_link(self, org_el: etree._Element, document: OrganisationDocument) -> None:
         """Add a document-link element to the organisation."""
-        doc_el = ET.SubElement(org_el, "document-link")
-        _set_attribute(doc_el, "url", document.url)
-        _set_attribute(doc_el, "format", document.format)
+        doc_el = _sub(org_el, "document-link", url=document.url, format=document.format)
 
         if document.title:
-            title_el = ET.SubElement(doc_el, "title")
-            _add_narrative(title_el, document.title)
+            _add_narrative(_sub(doc_el, "title"), document.title)
 
         if document.category_code:
-            category = ET.SubElement(doc_el, "category")
-            _set_attribute(category, "code", document.category_code)
+            _sub(doc_el, "category", code=document.category_code)
 
         if document.language:
-            language = ET.SubElement(doc_el, "language")
-            _set_attribute(language, "code", document.language)
+            _sub(doc_el, "language", code=document.language)
 
         if document.document_date:
-            doc_date = ET.SubElement(doc_el, "document-date")
-            _set_attribute(doc_date, "iso-date", document.document_date)
+            _sub(doc_el, "document-date", iso_date=document.document_date)
 
-    def to_string(self, root: ET.Element) -> str:
+    def to_string(self, root: etree._Element) -> str:
         """Convert the XML to a properly formatted string."""
-        xml_string = _pretty_xml(root)
+        return _xml_header() + etree.tostring(root, encoding="unicode", pretty_print=True)
 
-        repo_url = "https://github.com/okfn/okfn-iati"
-        comment = f"<!-- Generated by OKFN-IATI Organisation XML Generator: {repo_url} -->"
+    def save_to_file(self, root: etree._Element, file_path: Union[str, Path]) -> None:
+        """Save the XML to a file, serialising straight to disk (same output as to_string)."""
+        with open(file_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(_xml_header().encode("utf-8"))
+            etree.ElementTree(root).write(f, encoding="utf-8", xml_declaration=False, pretty_print=True)
 
-        xml_declaration_end = xml_string.find("?>") + 2
-        xml_string = xml_string[:xml_declaration_end] + "\n" + comment + xml_string[xml_declaration_end:]
+    def save_organisations_to_file(
+            self,
+            records: Iterable[OrganisationRecord],
+            file_path: Union[str, Path],
+            workers: int = 1,
+            chunk_size: int = 64
+    ) -> None:
+        """
+        Write organisation records to a file, optionally building and serialising them in worker processes.
+
+        The output is the same document that build_root_element, add_organisations
+        and save_to_file would produce; organisations keep the order of records.
+
+        Args:
+            records: Organisation records to write
+            file_path: Path to output XML file
+            workers: Number of worker processes (default: 1, no pool). With more than one,
+                the calling script needs an ``if __name__ == "__main__":`` guard on spawn platforms
+            chunk_size: Number of organisations serialised per worker task
+        """
+        records = list(records)
+        root = self.build_root_element()
+        if not records:
+            self.save_to_file(root, file_path)
+            return
+
+        root.text = "\n"
+        opening, closing = etree.tostring(root, encoding="unicode").split("\n", 1)
+        chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+        serialize = partial(_serialize_organisations, self.iati_version, self._generated_datetime)
+
+        with open(file_path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(_xml_header())
+            f.write(opening)
+            if workers > 1 and len(chunks) > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    f.writelines(executor.map(serialize, chunks))
+            else:
+                f.writelines(map(serialize, chunks))
+            f.write("\n" + closing + "\n")
 
-        return xml_string
+    def stream_organisations_to_file(self, records: Iterable[OrganisationRecord], file_path: Union[str, Path]) -> int:
+        """
+        Write organisation records to a file one at a time with an incremental writer.
 
-    def save_to_file(self, root: ET.Element, file_path: Union[str, Path]) -> None:
-        """Save the XML to a file."""
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(self.to_string(root))
+        Only the organisation being written is held as a tree, so records can be a
+        lazy iterable of any length. Non-empty output matches save_organisations_to_file.
+
+        Args:
+            records: Organisation records to write
+            file_path: Path to output XML file
+
+        Returns:
+            int: Number of organisations written
+        """
+        root = self.build_root_element()
+        # Organisations are built under a parent without nsmap so they don't repeat the declarations
+        parent = etree.Element("iati-organisations")
+        count = 0
+
+        with open(file_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(_xml_header().encode("utf-8"))
+            with etree.xmlfile(f, encoding="utf-8") as xf:
+                with xf.element(root.tag, root.attrib, nsmap=_ROOT_NSMAP):
+                    for record in records:
+                        org_el = self.add_organisation(parent, record)
+                        etree.indent(org_el, space="  ", level=1)
+                        org_el.tail = None
+                        xf.write("\n  ", org_el)
+                        parent.remove(org_el)
+                        count += 1
+                    xf.write("\n")
+            f.write(b"\n")
+
+        return count
+
+
+def _serialize_organisations(
+        iati_version: str, generated_datetime: str, records: List[OrganisationRecord]
+) -> str:
+    """Serialise records as indented iati-organisation fragments (runs in pool workers)."""
+    generator = IatiOrganisationXMLGenerator(iati_version)
+    generator._generated_datetime = generated_datetime
+    parts = []
+    for org_el in generator.add_organisations(etree.Element("iati-organisations"), records):
+        etree.indent(org_el, space="  ", level=1)
+        parts.append("\n  " + etree.tostring(org_el, encoding="unicode", with_tail=False))
+    return "".join(parts)
+
+
+def _read_organisation_file(
+        converter: "IatiOrganisationCSVConverter", file_path: Path
+) -> Tuple[Optional[OrganisationRecord], Optional[str]]:
+    """Read one organisation file, returning its record or the error message (runs in pool workers)."""
+    try:
+        return converter.read_from_file(file_path), None
+    except Exception as e:
+        return None, str(e)
 
 
 class IatiOrganisationCSVConverter:
@@ -330,7 +919,9 @@ class IatiOrganisationCSVConverter:
     3. Process multiple organisation files in batch
     """
 
-    # Define field name mappings for CSV columns
+    # Define field name mappings for CSV columns. _map_fields takes the first alias
+    # with a value, so each list starts with the generate_template column name and
+    # keeps localized and legacy aliases last.
     FIELD_MAPPINGS = {
         "org_identifier": ["organisation identifier", "organization identifier",
                            "organisation-identifier", "org identifier",
@@ -343,8 +934,8 @@ class IatiOrganisationCSVConverter:
         # Budget fields
         "budget_kind": ["budget kind", "budget_type", "budget type", "tipo presupuesto"],
         "budget_status": ["budget status", "status", "estado"],
-        "budget_start": ["period start", "budget period start", "period-start", "inicio"],
-        "budget_end": ["period end", "budget period end", "period-end", "fin"],
+        "budget_start": ["budget period start", "period start", "period-start", "inicio"],
+        "budget_end": ["budget period end", "period end", "period-end", "fin"],
         "budget_value": ["budget value", "value", "monto", "valor"],
         "budget_currency": ["currency", "moneda"],
         "budget_value_date": ["value date", "value-date", "fecha valor"],
@@ -368,11 +959,11 @@ class IatiOrganisationCSVConverter:
 
         # Expenditure fields
         "expenditure_start": [
-            "expenditure start", "expenditure period start",
+            "expenditure period start", "expenditure start",
             "expenditure-start", "gasto inicio"
         ],
         "expenditure_end": [
-            "expenditure end", "expenditure period end",
+            "expenditure period end", "expenditure end",
             "expenditure-end", "gasto fin"
         ],
         "expenditure_value": ["expenditure value", "expenditure", "gasto valor"],
@@ -391,9 +982,35 @@ class IatiOrganisationCSVConverter:
         "document_date": ["document date", "date", "fecha documento"]
     }
 
-    def __init__(self):
-        """Initialize the converter."""
+    # FIELD_MAPPINGS inverted to normalized alias -> (field name, alias position), see _map_fields
+    _FIELD_ALIASES = {
+        alias.lower().strip(): (field_name, rank)
+        for field_name, aliases in FIELD_MAPPINGS.items()
+        for rank, alias in enumerate(aliases)
+    }
+
+    # First-row reader method for each supported file extension, see _read_first_row
+    _FIRST_ROW_READERS = {
+        ".csv": "_read_first_row_csv",
+        ".xlsx": "_read_first_row_excel",
+        ".xls": "_read_first_row_excel",
+    }
+
+    # Folders are read in a process pool only when they hold at least this
+    # many files; below that the pool start-up cost outweighs the gain.
+    parallel_read_threshold = 32
+
+    def __init__(self, clean_money_values: bool = False) -> None:
+        """
+        Initialize the converter.
+
+        Args:
+            clean_money_values: Strip currency symbols, spaces and thousands separators from
+                budget and expenditure values read from files, e.g. "$1,500,000.00" -> "1500000.00".
+                Off by default, so values are kept exactly as given.
+        """
         self.xml_generator = IatiOrganisationXMLGenerator()
+        self.clean_money_values = clean_money_values
 
     def read_from_file(self, file_path: Union[str, Path]) -> OrganisationRecord:
         """
@@ -411,10 +1028,32 @@ class IatiOrganisationCSVConverter:
         # Determine file type and read the first row
         file_path = Path(file_path)
         row = self._read_first_row(file_path)
+        return self._record_from_row(row, file_path.name)
+
+    def _record_from_row(self, row: Dict[str, str], source_name: str) -> OrganisationRecord:
+        """
+        Build an OrganisationRecord from a row as returned by _read_first_row.
+
+        The row's columns are mapped to fields once, see _map_fields.
+
+        Args:
+            row: Column name to stripped value
+            source_name: File name used in warnings
+
+        Returns:
+            OrganisationRecord: Organisation data from the row
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        fields = _map_fields(row, self._FIELD_ALIASES)
+
+        def get(field_name: str, default: str = "") -> str:
+            return fields.get(field_name, default)
 
         # Extract organisation data
-        org_identifier = _get_field(row, self.FIELD_MAPPINGS["org_identifier"])
-        name = _get_field(row, self.FIELD_MAPPINGS["name"])
+        org_identifier = get("org_identifier")
+        name = get("name")
 
         if not org_identifier or not name:
             raise ValueError("Missing required 'organisation identifier' or 'name' in the file")
@@ -425,7 +1064,7 @@ class IatiOrganisationCSVConverter:
         # If completely missing, use default language ("en")
         if xml_lang is None or not xml_lang.strip():
             logger.warning(
-                f"Missing 'xml_lang' in {file_path.name}, using default 'en'"
+                f"Missing 'xml_lang' in {source_name}, using default 'en'"
             )
             xml_lang = "en"
 
@@ -436,76 +1075,83 @@ class IatiOrganisationCSVConverter:
         record = OrganisationRecord(
             org_identifier=org_identifier,
             name=name,
-            reporting_org_ref=_get_field(row, self.FIELD_MAPPINGS["reporting_org_ref"]),
-            reporting_org_type=_get_field(row, self.FIELD_MAPPINGS["reporting_org_type"]),
-            reporting_org_name=_get_field(row, self.FIELD_MAPPINGS["reporting_org_name"]),
+            reporting_org_ref=get("reporting_org_ref"),
+            reporting_org_type=get("reporting_org_type"),
+            reporting_org_name=get("reporting_org_name"),
             xml_lang=xml_lang,
             default_currency=default_currency
         )
 
         # Extract budget if present
-        budget_kind = _get_field(row, self.FIELD_MAPPINGS["budget_kind"])
-        budget_value = _get_field(row, self.FIELD_MAPPINGS["budget_value"])
+        budget_kind = get("budget_kind")
+        budget_value = get("budget_value")
+        if self.clean_money_values:
+            budget_value = _to_iati_decimal(budget_value)
 
         if budget_kind and budget_value:
+            recipient_org_ref = get("recipient_org_ref")
+            recipient_org_name = get("recipient_org_name")
+            recipient_country_code = get("recipient_country_code")
+            recipient_region_code = get("recipient_region_code")
+
             # Determine actual budget kind if needed
-            if budget_kind.lower() in ["total", "total-budget", "total budget"]:
+            if budget_kind.lower() in _TOTAL_BUDGET_KINDS:
                 budget_kind = "total-budget"
-            elif any(_get_field(row, self.FIELD_MAPPINGS[f]) for f in [
-                "recipient_org_ref", "recipient_org_name"
-            ]):
+            elif recipient_org_ref or recipient_org_name:
                 budget_kind = "recipient-org-budget"
-            elif _get_field(row, self.FIELD_MAPPINGS["recipient_country_code"]):
+            elif recipient_country_code:
                 budget_kind = "recipient-country-budget"
-            elif _get_field(row, self.FIELD_MAPPINGS["recipient_region_code"]):
+            elif recipient_region_code:
                 budget_kind = "recipient-region-budget"
 
             # Create budget
             budget = OrganisationBudget(
                 kind=budget_kind,
-                status=_get_field(row, self.FIELD_MAPPINGS["budget_status"], "2"),  # Default to committed
-                period_start=_get_field(row, self.FIELD_MAPPINGS["budget_start"]),
-                period_end=_get_field(row, self.FIELD_MAPPINGS["budget_end"]),
+                status=get("budget_status", "2"),  # Default to committed
+                period_start=get("budget_start"),
+                period_end=get("budget_end"),
                 value=budget_value,
-                currency=_get_field(row, self.FIELD_MAPPINGS["budget_currency"], "USD"),
-                value_date=_get_field(row, self.FIELD_MAPPINGS["budget_value_date"]),
-                recipient_org_ref=_get_field(row, self.FIELD_MAPPINGS["recipient_org_ref"]),
-                recipient_org_type=_get_field(row, self.FIELD_MAPPINGS["recipient_org_type"]),
-                recipient_org_name=_get_field(row, self.FIELD_MAPPINGS["recipient_org_name"]),
-                recipient_country_code=_get_field(row, self.FIELD_MAPPINGS["recipient_country_code"]),
-                recipient_region_code=_get_field(row, self.FIELD_MAPPINGS["recipient_region_code"]),
-                recipient_region_vocabulary=_get_field(row, self.FIELD_MAPPINGS["recipient_region_vocabulary"])
+                currency=get("budget_currency", "USD"),
+                value_date=get("budget_value_date"),
+                recipient_org_ref=recipient_org_ref,
+                recipient_org_type=get("recipient_org_type"),
+                recipient_org_name=recipient_org_name,
+                recipient_country_code=recipient_country_code,
+                recipient_region_code=recipient_region_code,
+                recipient_region_vocabulary=get("recipient_region_vocabulary")
             )
             record.budgets.append(budget)
 
         # Extract expenditure if present
-        expenditure_value = _get_field(row, self.FIELD_MAPPINGS["expenditure_value"])
+        expenditure_value = get("expenditure_value")
+        if self.clean_money_values:
+            expenditure_value = _to_iati_decimal(expenditure_value)
         if expenditure_value:
             expenditure = OrganisationExpenditure(
-                period_start=_get_field(row, self.FIELD_MAPPINGS["expenditure_start"]),
-                period_end=_get_field(row, self.FIELD_MAPPINGS["expenditure_end"]),
+                period_start=get("expenditure_start"),
+                period_end=get("expenditure_end"),
                 value=expenditure_value,
-                currency=_get_field(row, self.FIELD_MAPPINGS["expenditure_currency"], "USD"),
-                value_date=_get_field(row, self.FIELD_MAPPINGS["expenditure_value_date"])
+                currency=get("expenditure_currency", "USD"),
+                value_date=get("expenditure_value_date")
             )
             record.expenditures.append(expenditure)
 
         # Extract document if present
-        document_url = _get_field(row, self.FIELD_MAPPINGS["document_url"])
+        document_url = get("document_url")
         if document_url:
             document = OrganisationDocument(
                 url=document_url,
-                format=_get_field(row, self.FIELD_MAPPINGS["document_format"], "text/html"),
-                title=_get_field(row, self.FIELD_MAPPINGS["document_title"], "Supporting document"),
-                category_code=_get_field(row, self.FIELD_MAPPINGS["document_category"], "A01"),  # Default to Annual Report
-                language=_get_field(row, self.FIELD_MAPPINGS["document_language"], "en"),
-                document_date=_get_field(row, self.FIELD_MAPPINGS["document_date"])
+                format=get("document_format", "text/html"),
+                title=get("document_title", "Supporting document"),
+                category_code=get("document_category", "A01"),  # Default to Annual Report
+                language=get("document_language", "en"),
+                document_date=get("document_date")
             )
             record.documents.append(document)
 
         return record
 
-    def _read_first_row(self, file_path: Path) -> Dict[str, Any]:
+    def _read_first_row(self, file_path: Path) -> Dict[str, str]:
         """
         Read the first data row from a CSV or Excel file.
 
@@ -518,41 +1164,75 @@ class IatiOrganisationCSVConverter:
         Raises:
             ValueError: If file format is unsupported or file is empty
         """
-        # Handle Excel files if pandas is available
-        if PANDAS_AVAILABLE and file_path.suffix.lower() in [".xlsx", ".xls"]:
-            df = pd.read_excel(file_path)
-            if df.empty:
-                raise ValueError(f"File {file_path} is empty")
-
-            # Convert first row to dictionary
-            row = df.iloc[0].to_dict()
-            # Normalize row keys and values
-            return {
-                str(k).strip(): ("" if pd.isna(v) else str(v).strip())
-                for k, v in row.items()
-            }
+        reader = self._FIRST_ROW_READERS.get(file_path.suffix.lower())
+        if reader is None:
+            raise ValueError(
+                f"Unsupported file format: {file_path.suffix}. "
+                "Use CSV or Excel (.xlsx/.xls) files."
+            )
+        return getattr(self, reader)(file_path)
+
+    def _read_first_row_csv(self, file_path: Path) -> Dict[str, str]:
+        """Read the first non-blank data row of a CSV file."""
+        with open(file_path, "r", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            # Get first non-blank row
+            values = next((r for r in reader if r), None)
+        if header is None or values is None:
+            raise ValueError(f"File {file_path} has no data rows")
+
+        # Normalize row; missing trailing cells read as empty and extra cells are ignored
+        return {
+            name.strip(): value.strip()
+            for name, value in zip_longest(header, values[:len(header)], fillvalue="")
+        }
 
-        # Handle CSV files
-        elif file_path.suffix.lower() == ".csv":
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                try:
-                    # Get first row
-                    row = next(reader)
-                    # Normalize row
-                    return {
-                        str(k).strip(): ("" if v is None else str(v).strip())
-                        for k, v in row.items()
-                    }
-                except StopIteration:
-                    raise ValueError(f"File {file_path} has no data rows")
+    def _read_first_row_excel(self, file_path: Path) -> Dict[str, str]:
+        """Read the first data row of an Excel file with openpyxl (.xlsx) or pandas."""
+        # Stream just the header and first row of .xlsx files when openpyxl is available
+        if OPENPYXL_AVAILABLE and file_path.suffix.lower() == ".xlsx":
+            return self._read_first_row_xlsx(file_path)
 
-        else:
+        pd = _load_pandas()
+        if pd is None:
             raise ValueError(
                 f"Unsupported file format: {file_path.suffix}. "
                 "Use CSV or Excel (.xlsx/.xls) files."
             )
 
+        # Only the header and the first data row are used
+        df = pd.read_excel(file_path, nrows=1, dtype=str)
+        if df.empty:
+            raise ValueError(f"File {file_path} is empty")
+
+        # Normalize keys and values with column-wise string operations
+        df.columns = df.columns.astype(str).str.strip()
+        return df.iloc[0].fillna("").str.strip().to_dict()
+
+    def _read_first_row_xlsx(self, file_path: Path) -> Dict[str, str]:
+        """Read the first data row of an .xlsx file without loading the rest of the sheet."""
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            # Get first non-blank row
+            values = next((r for r in rows if any(v is not None for v in r)), None)
+        finally:
+            workbook.close()
+
+        if header is None or values is None:
+            raise ValueError(f"File {file_path} is empty")
+
+        # Normalize row keys and values
+        return {
+            str(k).strip(): ("" if v is None else str(v).strip())
+            for k, v in zip(header, values)
+            if k is not None
+        }
+
     def convert_to_xml(self,
                        input_file: Union[str, Path],
                        output_file: Union[str, Path]) -> str:
@@ -589,12 +1269,19 @@ class IatiOrganisationCSVConverter:
             logger.error(f"Failed to convert {input_file} to IATI XML: {str(e)}")
             raise ValueError(f"Conversion failed: {str(e)}")
 
-    def read_multiple_from_folder(self, folder_path: Union[str, Path]) -> List[OrganisationRecord]:
+    def read_multiple_from_folder(
+            self,
+            folder_path: Union[str, Path],
+            workers: int = 1
+    ) -> List[OrganisationRecord]:
         """
         Read organisation data from multiple CSV/Excel files in a folder.
 
         Args:
             folder_path: Path to folder containing CSV or Excel files
+            workers: Number of worker processes for folders of at least parallel_read_threshold
+                files (default: 1, no pool). With more than one, the calling script needs an
+                ``if __name__ == "__main__":`` guard on spawn platforms
 
         Returns:
             List[OrganisationRecord]: List of organisation records from all files
@@ -610,29 +1297,36 @@ class IatiOrganisationCSVConverter:
         if not folder_path.is_dir():
             raise ValueError(f"Path is not a directory: {folder_path}")
 
-        # Find all CSV and Excel files
-        file_patterns = ["*.csv", "*.xlsx", "*.xls"]
+        # Find all files with a first-row reader (CSV and Excel)
         files = []
-        for pattern in file_patterns:
-            files.extend(folder_path.glob(pattern))
+        for extension in self._FIRST_ROW_READERS:
+            files.extend(folder_path.glob(f"*{extension}"))
 
         if not files:
             raise ValueError(f"No CSV or Excel files found in folder: {folder_path}")
 
+        files.sort()
+        read = partial(_read_organisation_file, self)
+
+        # Each file is independent, so large folders can be spread across processes
+        if workers > 1 and len(files) >= self.parallel_read_threshold:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(read, files, chunksize=max(1, len(files) // (4 * workers))))
+        else:
+            results = map(read, files)
+
         organisations = []
         processed_files = []
         failed_files = []
 
-        for file_path in sorted(files):
-            try:
-                logger.info(f"Processing organisation file: {file_path.name}")
-                record = self.read_from_file(file_path)
+        for file_path, (record, error) in zip(files, results):
+            logger.info(f"Processing organisation file: {file_path.name}")
+            if error is None:
                 organisations.append(record)
                 processed_files.append(file_path.name)
-            except Exception as e:
-                logger.warning(f"Failed to process {file_path.name}: {str(e)}")
-                failed_files.append((file_path.name, str(e)))
-                continue
+            else:
+                logger.warning(f"Failed to process {file_path.name}: {error}")
+                failed_files.append((file_path.name, error))
 
         if not organisations:
             raise ValueError(
@@ -674,9 +1368,7 @@ class IatiOrganisationCSVConverter:
 
             # Generate XML with all organisations
             root = self.xml_generator.build_root_element()
-
-            for record in records:
-                self.xml_generator.add_organisation(root, record)
+            self.xml_generator.add_organisations(root, records)
 
             # Save XML to file
             output_path = Path(output_file)
@@ -692,6 +1384,87 @@ class IatiOrganisationCSVConverter:
             logger.error(f"Failed to convert folder {input_folder} to IATI XML: {str(e)}")
             raise ValueError(f"Folder conversion failed: {str(e)}")
 
+    def stream_folder_to_xml(
+            self,
+            input_folder: Union[str, Path],
+            output_file: Union[str, Path]
+    ) -> str:
+        """
+        Convert a folder of organisation CSV/Excel files to a single IATI XML file, one file at a time.
+
+        Unlike convert_folder_to_xml, records are not collected first: each file is
+        read, written and released before the next, so memory use does not grow
+        with the size of the folder. Files that cannot be read are skipped with a warning.
+
+        Args:
+            input_folder: Path to folder containing CSV or Excel files
+            output_file: Path to output XML file
+
+        Returns:
+            str: Path to generated XML file
+
+        Raises:
+            ValueError: If the folder is missing or no file could be converted
+        """
+        input_folder = Path(input_folder)
+        if not input_folder.is_dir():
+            raise ValueError(f"Folder does not exist: {input_folder}")
+
+        files = sorted(
+            path for extension in self._FIRST_ROW_READERS for path in input_folder.glob(f"*{extension}")
+        )
+
+        def records() -> Iterable[OrganisationRecord]:
+            for file_path in files:
+                record, error = _read_organisation_file(self, file_path)
+                if error is None:
+                    yield record
+                else:
+                    logger.warning(f"Failed to process {file_path.name}: {error}")
+
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        count = self.xml_generator.stream_organisations_to_file(records(), output_path)
+
+        if not count:
+            output_path.unlink()
+            raise ValueError(f"No valid organisation data found in folder {input_folder}")
+
+        logger.info(f"Successfully generated IATI organisation XML with {count} organisations: {output_path}")
+        return str(output_path)
+
+    def convert_many_to_xml(
+            self,
+            records: Iterable[OrganisationRecord],
+            output_file: Union[str, Path],
+            workers: int = 1
+    ) -> str:
+        """
+        Convert many organisation records to a single IATI XML file, optionally building them in parallel.
+
+        Args:
+            records: Organisation records to convert
+            output_file: Path to output XML file
+            workers: Number of worker processes (default: 1, no pool), see save_organisations_to_file
+
+        Returns:
+            str: Path to generated XML file
+
+        Raises:
+            ValueError: If conversion fails
+        """
+        try:
+            output_path = Path(output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self.xml_generator.save_organisations_to_file(records, output_path, workers=workers)
+
+            logger.info(f"Successfully generated IATI organisation XML: {output_path}")
+            return str(output_path)
+
+        except Exception as e:
+            logger.error(f"Failed to convert organisation records to IATI XML: {str(e)}")
+            raise ValueError(f"Conversion failed: {str(e)}")
+
     def validate_organisation_identifiers(self, records: List[OrganisationRecord]) -> List[str]:
         """
         Check for duplicate organisation identifiers in a list of records.
@@ -723,95 +1496,65 @@ class IatiOrganisationCSVConverter:
             with_examples: Whether to include example data
 
         Raises:
-            ValueError: If file creation fails
+            ValueError: If the file cannot be created or written (the OSError is its __cause__)
         """
-        # Define template columns
-        columns = [
-            # Basic organisation info
-            "Organisation Identifier",
-            "Name",
-            "Reporting Org Ref",
-            "Reporting Org Type",
-            "Reporting Org Name",
-
-            # Budget info
-            "Budget Kind",
-            "Budget Status",
-            "Budget Period Start",
-            "Budget Period End",
-            "Budget Value",
-            "Currency",
-            "Value Date",
-
-            # Recipient info
-            "Recipient Org Ref",
-            "Recipient Org Type",
-            "Recipient Org Name",
-            "Recipient Country Code",
-            "Recipient Region Code",
-            "Recipient Region Vocabulary",
-
-            # Document info
-            "Document URL",
-            "Document Format",
-            "Document Title",
-            "Document Category",
-            "Document Language",
-            "Document Date",
-
-            # Expenditure info
-            "Expenditure Period Start",
-            "Expenditure Period End",
-            "Expenditure Value",
-            "Expenditure Currency"
-        ]
-
         try:
             output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Add example row if requested
+            payload = _TEMPLATE_HEADER_BYTES + _TEMPLATE_EXAMPLE_BYTES if with_examples else _TEMPLATE_HEADER_BYTES
+
+            # The whole template is a few hundred bytes: written on a raw descriptor,
+            # normally in a single os.write call
+            try:
+                fd = os.open(output_path, _TEMPLATE_OPEN_FLAGS, 0o666)
+            except FileNotFoundError:
+                # Only touch the parent directory when it is actually missing
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(output_path, _TEMPLATE_OPEN_FLAGS, 0o666)
+            try:
+                remaining = memoryview(payload)
+                while remaining:
+                    # os.write may write fewer bytes than given
+                    remaining = remaining[os.write(fd, remaining):]
+            finally:
+                os.close(fd)
 
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(columns)
-
-                # Add example row if requested
-                if with_examples:
-                    writer.writerow([
-                        "XM-DAC-46002",  # Organisation Identifier
-                        "Sample Organisation",  # Name
-                        "XM-DAC-46002",  # Reporting Org Ref
-                        "40",  # Reporting Org Type
-                        "Sample Organisation",  # Reporting Org Name
-                        "total-budget",  # Budget Kind
-                        "2",  # Budget Status
-                        "2025-01-01",  # Budget Period Start
-                        "2025-12-31",  # Budget Period End
-                        "1000000",  # Budget Value
-                        "USD",  # Currency
-                        "2025-01-01",  # Value Date
-                        "",  # Recipient Org Ref
-                        "",  # Recipient Org Type
-                        "",  # Recipient Org Name
-                        "",  # Recipient Country Code
-                        "",  # Recipient Region Code
-                        "",  # Recipient Region Vocabulary
-                        "https://example.org/annual-report",  # Document URL
-                        "text/html",  # Document Format
-                        "Annual Report",  # Document Title
-                        "A01",  # Document Category
-                        "en",  # Document Language
-                        "2025-01-01",  # Document Date
-                        "2025-01-01",  # Expenditure Period Start
-                        "2025-12-31",  # Expenditure Period End
-                        "950000",  # Expenditure Value
-                        "USD"  # Expenditure Currency
-                    ])
-
-            logger.info(f"Generated IATI organisation template: {output_path}")
+            logger.info("Generated IATI organisation template: %s", output_path)
 
-        except Exception as e:
-            logger.error(f"Failed to create template {output_file}: {str(e)}")
-            raise ValueError(f"Template creation failed: {str(e)}")
+        except OSError as e:
+            logger.error("Failed to create template %s: %s", output_file, e)
+            raise ValueError(f"Template creation failed: {e}") from e
+
+    def generate_templates(
+            self,
+            output_files: Iterable[Union[str, Path]],
+            with_examples: bool = True,
+            workers: Optional[int] = None
+    ) -> None:
+        """
+        Generate several CSV templates, writing them concurrently.
+
+        Each template is a couple of pre-encoded writes, so files are written from
+        a thread pool (the GIL is released during file I/O) rather than processes.
+
+        Args:
+            output_files: Paths to output CSV template files
+            with_examples: Whether to include example data
+            workers: Number of writer threads (default: CPU count, 1 disables the pool)
+
+        Raises:
+            ValueError: If creating any of the files fails
+        """
+        output_files = list(output_files)
+        generate = partial(self.generate_template, with_examples=with_examples)
+        workers = workers or os.cpu_count() or 1
+
+        if workers > 1 and len(output_files) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(generate, output_files))
+        else:
+            for output_file in output_files:
+                generate(output_file)
 
 
 class IatiOrganisationMultiCsvConverter:
@@ -821,50 +1564,42 @@ class IatiOrganisationMultiCsvConverter:
         'organisations': {
             'filename': 'organisations.csv',
             "required": True,
-            'columns': [
-                'organisation_identifier', 'name', 'reporting_org_ref',
-                'reporting_org_type', 'reporting_org_name', 'reporting_org_lang',
-                'default_currency', 'xml_lang'
-            ]
+            'columns': list(_ORGANISATIONS_COLUMNS)
         },
         'names': {
             'filename': 'names.csv',
             "required": False,
-            'columns': ['organisation_identifier', 'language', 'name']
+            'columns': list(_NAMES_COLUMNS)
         },
         'budgets': {
             'filename': 'budgets.csv',
             "required": False,
-            'columns': [
-                'organisation_identifier', 'budget_kind', 'budget_status',
-                'period_start', 'period_end', 'value', 'currency', 'value_date',
-                'recipient_org_ref', 'recipient_org_type', 'recipient_org_name',
-                'recipient_country_code', 'recipient_region_code', 'recipient_region_vocabulary'
-            ]
+            'columns': list(_BUDGETS_COLUMNS)
         },
         'expenditures': {
             'filename': 'expenditures.csv',
             "required": False,
-            'columns': [
-                'organisation_identifier', 'period_start', 'period_end',
-                'value', 'currency', 'value_date'
-            ]
+            'columns': list(_EXPENDITURES_COLUMNS)
         },
         'documents': {
             'filename': 'documents.csv',
             "required": False,
-            'columns': [
-                'organisation_identifier', 'url', 'format', 'title',
-                'category_code', 'language', 'document_date'
-            ]
+            'columns': list(_DOCUMENTS_COLUMNS)
         }
     }
 
-    def __init__(self):
-        """Initialize the multi-CSV converter."""
+    def __init__(self, cache_csv_reads: bool = False) -> None:
+        """
+        Initialize the multi-CSV converter.
+
+        Args:
+            cache_csv_reads: Keep parsed CSV files on this converter and reuse them while a
+                file's content is unchanged, for callers that convert the same folder repeatedly
+        """
         self.latest_errors: List[str] = []
         self.latest_warnings: List[str] = []
         self.xml_generator = IatiOrganisationXMLGenerator()
+        self._csv_cache: Optional[Dict[str, Tuple[bytes, _ParsedCsv]]] = {} if cache_csv_reads else None
 
     @classmethod
     def required_csv_files(cls) -> list[str]:
@@ -891,52 +1626,129 @@ class IatiOrganisationMultiCsvConverter:
             if not xml_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
 
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-
             output_path = Path(output_folder)
             output_path.mkdir(parents=True, exist_ok=True)
 
-            organisations_data = []
-            names_data = []
-            budgets_data = []
-            expenditures_data = []
-            documents_data = []
+            with ExitStack() as stack:
+                writers = {
+                    csv_type: _LazyCsvWriter(stack, output_path / config['filename'], config['columns'])
+                    for csv_type, config in self.csv_files.items()
+                }
+                # organisations.csv is always written; the others only when they get rows
+                organisations_writer = writers['organisations']
+                organisations_writer.open()
+                names_writer = writers['names']
+
+                # names.csv is only needed once an organisation has several names; until
+                # then names are held back, with a count per organisation identifier
+                pending_names: List[Dict[str, str]] = []
+                name_counts: Dict[str, int] = {}
+
+                # Parse incrementally and write each organisation's rows as soon as it
+                # is read, so memory doesn't grow with the size of the XML file
+                for _, org_elem in etree.iterparse(str(xml_path), events=('end',), tag='iati-organisation'):
+                    basic_info = extract_organisation_basic_info(org_elem)
+                    org_id = basic_info['organisation_identifier']
+
+                    organisations_writer.writerows([basic_info])
+
+                    names = extract_organisation_names(org_elem, org_id)
+                    if names_writer.opened:
+                        names_writer.writerows(names)
+                    elif names:
+                        pending_names.extend(names)
+                        name_counts[org_id] = name_counts.get(org_id, 0) + len(names)
+                        if name_counts[org_id] > 1:
+                            names_writer.writerows(pending_names)
+                            pending_names = []
+                            name_counts = {}
+
+                    writers['budgets'].writerows(extract_organisation_budgets(org_elem, org_id))
+                    writers['expenditures'].writerows(extract_organisation_expenditures(org_elem, org_id))
+                    writers['documents'].writerows(extract_organisation_documents(org_elem, org_id))
+
+                    org_elem.clear()
+                    while org_elem.getprevious() is not None:
+                        del org_elem.getparent()[0]
 
-            for org_elem in root.findall('.//iati-organisation'):
-                basic_info = extract_organisation_basic_info(org_elem)
-                org_id = basic_info['organisation_identifier']
+            logger.info(f"Successfully converted organisation XML to CSV folder: {output_path}")
+            return True
 
-                organisations_data.append(basic_info)
-                names_data.extend(extract_organisation_names(org_elem, org_id))
-                budgets_data.extend(extract_organisation_budgets(org_elem, org_id))
-                expenditures_data.extend(extract_organisation_expenditures(org_elem, org_id))
-                documents_data.extend(extract_organisation_documents(org_elem, org_id))
+        except Exception as e:
+            error_msg = f"Error during XML to CSV conversion: {str(e)}"
+            self.latest_errors.append(error_msg)
+            logger.error(error_msg)
+            return False
 
-            self._write_organisations_csv(organisations_data, output_path / "organisations.csv")
+    def xml_to_parquet_folder(
+        self,
+        xml_input: Union[str, Path],
+        output_folder: Union[str, Path],
+        batch_size: int = 65536,
+        compression: str = "zstd"
+    ) -> bool:
+        """
+        Convert IATI organisation XML to one Parquet file per table (requires pyarrow).
 
-            multi_name_count = 0
-            for org_id in {n["organisation_identifier"] for n in names_data}:
-                if sum(1 for n in names_data if n["organisation_identifier"] == org_id) > 1:
-                    multi_name_count += 1
+        Writes organisations.parquet and, when they have rows, names, budgets,
+        expenditures and documents files with the same columns as the CSV files.
+        Unlike the CSV output, values are typed: money values are float64 and
+        dates date32, and every name is written. A value that does not parse
+        is written as null and reported in latest_warnings. Rows are written in
+        record batches of batch_size as the XML is parsed.
 
-            if multi_name_count > 0:
-                self._write_names_csv(names_data, output_path / "names.csv")
+        Args:
+            xml_input: Path to IATI organisation XML file
+            output_folder: Folder for the Parquet files
+            batch_size: Rows per record batch
+            compression: Parquet compression codec
 
-            if budgets_data:
-                self._write_budgets_csv(budgets_data, output_path / "budgets.csv")
+        Returns:
+            bool: True on success; errors are recorded in latest_errors
+        """
+        self.latest_errors = []
+        self.latest_warnings = []
+        try:
+            if not PYARROW_AVAILABLE:
+                raise ValueError("pyarrow is required for Parquet output")
 
-            if expenditures_data:
-                self._write_expenditures_csv(expenditures_data, output_path / "expenditures.csv")
+            xml_path = Path(xml_input)
+            if not xml_path.exists():
+                raise ValueError(f"XML file not found: {xml_path}")
 
-            if documents_data:
-                self._write_documents_csv(documents_data, output_path / "documents.csv")
+            output_path = Path(output_folder)
+            output_path.mkdir(parents=True, exist_ok=True)
 
-            logger.info(f"Successfully converted organisation XML to CSV folder: {output_path}")
+            writers = {
+                csv_type: _ParquetTableWriter(
+                    output_path / config['filename'].replace('.csv', '.parquet'),
+                    config['columns'], batch_size, compression, self.latest_warnings
+                )
+                for csv_type, config in self.csv_files.items()
+            }
+            try:
+                for _, org_elem in etree.iterparse(str(xml_path), events=('end',), tag='iati-organisation'):
+                    basic_info = extract_organisation_basic_info(org_elem)
+                    org_id = basic_info['organisation_identifier']
+
+                    writers['organisations'].writerows([basic_info])
+                    writers['names'].writerows(extract_organisation_names(org_elem, org_id))
+                    writers['budgets'].writerows(extract_organisation_budgets(org_elem, org_id))
+                    writers['expenditures'].writerows(extract_organisation_expenditures(org_elem, org_id))
+                    writers['documents'].writerows(extract_organisation_documents(org_elem, org_id))
+
+                    org_elem.clear()
+                    while org_elem.getprevious() is not None:
+                        del org_elem.getparent()[0]
+            finally:
+                for csv_type, writer in writers.items():
+                    writer.close(always=csv_type == 'organisations')
+
+            logger.info(f"Successfully converted organisation XML to Parquet folder: {output_path}")
             return True
 
         except Exception as e:
-            error_msg = f"Error during XML to CSV conversion: {str(e)}"
+            error_msg = f"Error during XML to Parquet conversion: {str(e)}"
             self.latest_errors.append(error_msg)
             logger.error(error_msg)
             return False
@@ -964,45 +1776,41 @@ class IatiOrganisationMultiCsvConverter:
                 folder_path / "documents.csv"
             ) if (folder_path / "documents.csv").exists() else []
 
-            org_data_map = {}
-            for org in organisations:
-                org_id = org['organisation_identifier']
-                org_data_map[org_id] = {
-                    'basic_info': org,
-                    'names': [],
-                    'budgets': [],
-                    'expenditures': [],
-                    'documents': []
-                }
-
-            for name in names:
-                org_id = name['organisation_identifier']
-                if org_id in org_data_map:
-                    org_data_map[org_id]['names'].append(name)
-
-            for budget in budgets:
-                org_id = budget['organisation_identifier']
-                if org_id in org_data_map:
-                    org_data_map[org_id]['budgets'].append(budget)
-
-            for expenditure in expenditures:
-                org_id = expenditure['organisation_identifier']
-                if org_id in org_data_map:
-                    org_data_map[org_id]['expenditures'].append(expenditure)
-
-            for document in documents:
-                org_id = document['organisation_identifier']
-                if org_id in org_data_map:
-                    org_data_map[org_id]['documents'].append(document)
-
-            records = []
-            for org_id, data in org_data_map.items():
-                record = self._create_organisation_record_from_csv_data(data)
-                records.append(record)
+            # A repeated identifier keeps its first position and its last row
+            basic_info_by_org = {org['organisation_identifier']: org for org in organisations}
+
+            # Group each child table by organisation in one pass
+            rows_by_org = {}
+            orphan_rows = 0
+            for csv_type, rows in (
+                ('names', names), ('budgets', budgets), ('expenditures', expenditures), ('documents', documents)
+            ):
+                grouped = defaultdict(list)
+                for row in rows:
+                    grouped[row['organisation_identifier']].append(row)
+                orphan_rows += sum(
+                    len(org_rows) for org_id, org_rows in grouped.items() if org_id not in basic_info_by_org
+                )
+                rows_by_org[csv_type] = grouped
+
+            if orphan_rows:
+                warning_msg = f"Ignored {orphan_rows} rows for organisations missing from organisations.csv"
+                self.latest_warnings.append(warning_msg)
+                logger.warning(warning_msg)
+
+            records = [
+                self._create_organisation_record_from_csv_data({
+                    'basic_info': basic_info,
+                    'names': rows_by_org['names'].get(org_id, []),
+                    'budgets': rows_by_org['budgets'].get(org_id, []),
+                    'expenditures': rows_by_org['expenditures'].get(org_id, []),
+                    'documents': rows_by_org['documents'].get(org_id, []),
+                })
+                for org_id, basic_info in basic_info_by_org.items()
+            ]
 
             root = self.xml_generator.build_root_element()
-            for record in records:
-                self.xml_generator.add_organisation(root, record)
+            self.xml_generator.add_organisations(root, records)
 
             output_path = Path(xml_output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1017,130 +1825,25 @@ class IatiOrganisationMultiCsvConverter:
             logger.error(error_msg)
             return False
 
-    def _write_organisations_csv(self, data: List[Dict[str, str]], output_path: Path) -> None:
-        """Write organisations data to CSV."""
-        columns = [
-            'organisation_identifier', 'name', 'reporting_org_ref',
-            'reporting_org_type', 'reporting_org_name', 'reporting_org_lang',
-            'default_currency', 'xml_lang'
-        ]
-
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows(data)
-
-    def _write_names_csv(self, data: List[Dict[str, str]], output_path: Path) -> None:
-        """Write names data to CSV."""
-        columns = ['organisation_identifier', 'language', 'name']
-
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows(data)
-
-    def _write_budgets_csv(self, data: List[Dict[str, str]], output_path: Path) -> None:
-        """Write budgets data to CSV."""
-        columns = [
-            'organisation_identifier', 'budget_kind', 'budget_status',
-            'period_start', 'period_end', 'value', 'currency', 'value_date',
-            'recipient_org_ref', 'recipient_org_type', 'recipient_org_name',
-            'recipient_country_code', 'recipient_region_code', 'recipient_region_vocabulary'
-        ]
-
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows(data)
-
-    def _write_expenditures_csv(self, data: List[Dict[str, str]], output_path: Path) -> None:
-        """Write expenditures data to CSV."""
-        columns = [
-            'organisation_identifier', 'period_start', 'period_end',
-            'value', 'currency', 'value_date'
-        ]
-
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows(data)
-
-    def _write_documents_csv(self, data: List[Dict[str, str]], output_path: Path) -> None:
-        """Write documents data to CSV."""
-        columns = [
-            'organisation_identifier', 'url', 'format', 'title',
-            'category_code', 'language', 'document_date'
-        ]
-
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows(data)
-
     def _read_organisations_csv(self, csv_path: Path) -> List[Dict[str, str]]:
         """Read organisations CSV file."""
-        organisations = []
-
-        if not csv_path.exists():
-            return organisations
-
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            organisations = list(reader)
-
-        return organisations
+        return _read_csv_dicts(csv_path, self._csv_cache)
 
     def _read_names_csv(self, csv_path: Path) -> List[Dict[str, str]]:
         """Read names CSV file."""
-        names = []
-
-        if not csv_path.exists():
-            return names
-
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            names = list(reader)
-
-        return names
+        return _read_csv_dicts(csv_path, self._csv_cache)
 
     def _read_budgets_csv(self, csv_path: Path) -> List[Dict[str, str]]:
         """Read budgets CSV file."""
-        budgets = []
-
-        if not csv_path.exists():
-            return budgets
-
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            budgets = list(reader)
-
-        return budgets
+        return _read_csv_dicts(csv_path, self._csv_cache)
 
     def _read_expenditures_csv(self, csv_path: Path) -> List[Dict[str, str]]:
         """Read expenditures CSV file."""
-        expenditures = []
-
-        if not csv_path.exists():
-            return expenditures
-
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            expenditures = list(reader)
-
-        return expenditures
+        return _read_csv_dicts(csv_path, self._csv_cache)
 
     def _read_documents_csv(self, csv_path: Path) -> List[Dict[str, str]]:
         """Read documents CSV file."""
-        documents = []
-
-        if not csv_path.exists():
-            return documents
-
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            documents = list(reader)
-
-        return documents
+        return _read_csv_dicts(csv_path, self._csv_cache)
 
     def _create_organisation_record_from_csv_data(self, data: Dict[str, Any]) -> OrganisationRecord:
         """Create OrganisationRecord from CSV data."""
@@ -1195,89 +1898,10 @@ class IatiOrganisationMultiCsvConverter:
         output_path = Path(output_folder)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Generate organisations.csv template
-        org_columns = [
-            "organisation_identifier", "name", "reporting_org_ref",
-            "reporting_org_type", "reporting_org_name", "reporting_org_lang",
-            "default_currency", "xml_lang"
-        ]
-
-        with open(output_path / "organisations.csv", "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(org_columns)
-
-            if include_examples:
-                writer.writerow([
-                    "XM-DAC-46002", "Sample Organisation", "XM-DAC-46002",
-                    "40", "Sample Organisation", "en", "USD", "en"
-                ])
-
-        # Generate names.csv template
-        name_columns = [
-            'organisation_identifier', 'language', 'name'
-        ]
-
-        with open(output_path / "names.csv", 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(name_columns)
-
-            if include_examples:
-                writer.writerow([
-                    'XM-DAC-46002', '', 'Central American Bank for Economic Integration'
-                ])
-                writer.writerow([
-                    'XM-DAC-46002', 'es', 'Banco Centroamericano de Integración Económica'
-                ])
-
-        # Generate budgets.csv template
-        budget_columns = [
-            'organisation_identifier', 'budget_kind', 'budget_status',
-            'period_start', 'period_end', 'value', 'currency', 'value_date',
-            'recipient_org_ref', 'recipient_org_type', 'recipient_org_name',
-            'recipient_country_code', 'recipient_region_code', 'recipient_region_vocabulary'
-        ]
-
-        with open(output_path / "budgets.csv", 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(budget_columns)
-
-            if include_examples:
-                writer.writerow([
-                    'XM-DAC-46002', 'total-budget', '2',
-                    '2025-01-01', '2025-12-31', '1000000', 'USD', '2025-01-01',
-                    '', '', '', '', '', ''
-                ])
-
-        # Generate expenditures.csv template
-        expenditure_columns = [
-            'organisation_identifier', 'period_start', 'period_end',
-            'value', 'currency', 'value_date'
-        ]
-
-        with open(output_path / "expenditures.csv", 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(expenditure_columns)
-
-            if include_examples:
-                writer.writerow([
-                    'XM-DAC-46002', '2024-01-01', '2024-12-31',
-                    '950000', 'USD', '2024-01-01'
-                ])
-
-        # Generate documents.csv template
-        document_columns = [
-            'organisation_identifier', 'url', 'format', 'title',
-            'category_code', 'language', 'document_date'
-        ]
-
-        with open(output_path / "documents.csv", 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(document_columns)
-
+        for csv_type, config in self.csv_files.items():
+            rows = [config['columns']]
             if include_examples:
-                writer.writerow([
-                    'XM-DAC-46002', 'https://example.org/annual-report.pdf',
-                    'application/pdf', 'Annual Report 2024', 'A01', 'en', '2025-01-01'
-                ])
+                rows.extend(_MULTI_CSV_EXAMPLE_ROWS[csv_type])
+            _write_csv_rows(output_path / config['filename'], rows)
 
         logger.info(f"Generated organisation CSV templates in: {output_path}")
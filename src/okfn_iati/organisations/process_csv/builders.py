@@ -4,21 +4,27 @@ IATI organisation CSV to XML builders.
 Functions for building IATI organisation model objects from CSV row data.
 """
 
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, Optional
 
 # Import dataclasses from parent module - will need to be available
 # These are re-exported from base.py
 
 
+def _intern_code(value: Optional[str]) -> Optional[str]:
+    """Intern short codelist values that repeat on every row (budget kind, status, currency)."""
+    return sys.intern(value) if value else value
+
+
 def build_organisation_budget(budget_data: Dict[str, str]) -> Dict[str, Any]:
     """Build budget dictionary from CSV data."""
     budget = {
-        'kind': budget_data.get('budget_kind', 'total-budget'),
-        'status': budget_data.get('budget_status'),
+        'kind': _intern_code(budget_data.get('budget_kind', 'total-budget')),
+        'status': _intern_code(budget_data.get('budget_status')),
         'period_start': budget_data.get('period_start'),
         'period_end': budget_data.get('period_end'),
         'value': budget_data.get('value'),
-        'currency': budget_data.get('currency', 'USD'),
+        'currency': _intern_code(budget_data.get('currency', 'USD')),
         'value_date': budget_data.get('value_date'),
         'recipient_org_ref': budget_data.get('recipient_org_ref'),
         'recipient_org_type': budget_data.get('recipient_org_type'),
@@ -36,7 +42,7 @@ def build_organisation_expenditure(exp_data: Dict[str, str]) -> Dict[str, Any]:
         'period_start': exp_data.get('period_start'),
         'period_end': exp_data.get('period_end'),
         'value': exp_data.get('value'),
-        'currency': exp_data.get('currency', 'USD'),
+        'currency': _intern_code(exp_data.get('currency', 'USD')),
         'value_date': exp_data.get('value_date')
     }
     return expenditure
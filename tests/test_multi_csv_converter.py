@@ -0,0 +1,105 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from okfn_iati import IatiMultiCsvConverter, IatiActivities, Narrative
+from okfn_iati.activities import base as activities_base
+from okfn_iati.activities.process_csv.builders import BuildCache, build_narratives, build_result_with_indicators
+
+
+SAMPLE_FOLDER = Path(__file__).parent.parent / 'data-samples' / 'csv_folders' / 'wri-521'
+
+
+class TestIatiMultiCsvConverter(unittest.TestCase):
+    """Unit tests for the activities multi-CSV converter internals."""
+
+    def setUp(self):
+        self.converter = IatiMultiCsvConverter()
+        self.data_collections = {}
+        for csv_type, csv_config in self.converter.csv_files.items():
+            csv_path = SAMPLE_FOLDER / csv_config['filename']
+            self.data_collections[csv_type] = self.converter._read_csv_file(csv_path) if csv_path.exists() else []
+
+    def _to_xml(self, activities):
+        iati_activities = IatiActivities(
+            version="2.03",
+            generated_datetime="2025-01-01T00:00:00Z",
+            activities=activities
+        )
+        return self.converter.xml_generator.generate_iati_activities_xml(iati_activities)
+
+    def test_parallel_build_matches_sequential(self):
+        """Building activities in a process pool gives the same result as building them in order."""
+        sequential = self.converter._build_activities_from_collections(self.data_collections)
+
+        self.converter.parallel_build_threshold = 0
+        parallel = self.converter._build_activities_from_collections(self.data_collections, workers=2)
+
+        self.assertEqual(
+            [a.iati_identifier for a in sequential],
+            [a.iati_identifier for a in parallel]
+        )
+        self.assertEqual(self._to_xml(sequential), self._to_xml(parallel))
+
+    def test_empty_narratives_are_new_lists(self):
+        """Absent narratives are separate lists that callers can append to."""
+        first, second = build_narratives(None), build_narratives('', '')
+        first.append(Narrative(text="Added later"))
+
+        self.assertEqual(second, [])
+        self.assertEqual(build_narratives('Name', 'es'), [Narrative(text='Name', lang='es')])
+
+    def test_result_builder_shares_objects_only_through_a_cache(self):
+        """Repeated period rows share objects within one BuildCache; without a cache every object is new."""
+        indicators = [
+            {'indicator_ref': '1', 'title': 'Same title'},
+            {'indicator_ref': '2', 'title': 'Same title'},
+        ]
+        periods = [
+            {'indicator_ref': ref, 'period_start': '2024-01-01', 'period_end': '2024-12-31',
+             'target_value': '10', 'target_comment': 'Boilerplate'}
+            for ref in ('1', '2')
+        ]
+
+        shared = build_result_with_indicators({'title': 'Result'}, indicators, periods, BuildCache()).indicator
+        self.assertIs(shared[0].period[0], shared[1].period[0])
+        self.assertIs(shared[0].title[0], shared[1].title[0])
+
+        fresh = build_result_with_indicators({'title': 'Result'}, indicators, periods).indicator
+        self.assertIsNot(fresh[0].period[0], fresh[1].period[0])
+        self.assertIsNot(fresh[0].title[0], fresh[1].title[0])
+        self.assertEqual(fresh[0].period[0], shared[0].period[0])
+
+    @unittest.skipUnless(activities_base.PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_pyarrow_reader_matches_csv_module(self):
+        """The pyarrow CSV reader returns the same rows, as text, as csv.DictReader."""
+        for csv_path in sorted(SAMPLE_FOLDER.glob('*.csv')):
+            with self.subTest(csv_file=csv_path.name):
+                fast_rows = self.converter._read_csv_file(csv_path)
+                activities_base.PYARROW_AVAILABLE = False
+                try:
+                    plain_rows = self.converter._read_csv_file(csv_path)
+                finally:
+                    activities_base.PYARROW_AVAILABLE = True
+                self.assertEqual(fast_rows, plain_rows)
+
+    @unittest.skipUnless(activities_base.PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_pyarrow_reader_keeps_text_in_bom_files(self):
+        """A UTF-8 BOM file (as exported by Excel) reads the same with both readers, leading zeros included."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / 'activities.csv'
+            csv_path.write_text('activity_identifier,title\n001,First\n', encoding='utf-8-sig')
+
+            fast_rows = self.converter._read_csv_file(csv_path)
+            activities_base.PYARROW_AVAILABLE = False
+            try:
+                plain_rows = self.converter._read_csv_file(csv_path)
+            finally:
+                activities_base.PYARROW_AVAILABLE = True
+
+        self.assertEqual(fast_rows, plain_rows)
+        self.assertEqual(list(fast_rows[0].values()), ['001', 'First'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -204,6 +204,27 @@ class TestOrganisationBatchProcessing(unittest.TestCase):
         self.assertEqual(len(records), 1)
         self.assertEqual(records[0].org_identifier, "XM-DAC-VALID")
 
+    def test_parallel_read_matches_sequential(self):
+        """Reading a folder in a process pool gives the same records, in order, as reading it serially."""
+        for i in range(5):
+            self._create_org_csv(
+                self.test_folder / f"org_{i}.csv",
+                org_id=f"XM-DAC-{2000 + i}",
+                org_name=f"Organisation {i}",
+                budget_kind="total-budget",
+                budget_value=str((i + 1) * 1000)
+            )
+        with open(self.test_folder / "org_invalid.csv", 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows([["Wrong", "Headers"], ["Invalid", "Data"]])
+
+        sequential = self.converter.read_multiple_from_folder(self.test_folder, workers=1)
+
+        self.converter.parallel_read_threshold = 0
+        parallel = self.converter.read_multiple_from_folder(self.test_folder, workers=2)
+
+        self.assertEqual(len(parallel), 5)
+        self.assertEqual(sequential, parallel)
+
     def test_validation_across_multiple_files(self):
         """Test validation of organisation identifiers across multiple files."""
         # Create files with duplicate organisation identifiers
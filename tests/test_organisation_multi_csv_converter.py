@@ -1,9 +1,13 @@
+import csv
+import os
+import sys
 import unittest
 import tempfile
 from pathlib import Path
 import xml.etree.ElementTree as ET
 
 from okfn_iati.organisation_xml_generator import IatiOrganisationMultiCsvConverter
+from okfn_iati.organisations import base as organisations_base
 
 
 class TestOrganisationMultiCsvConverter(unittest.TestCase):
@@ -401,6 +405,159 @@ class TestOrganisationMultiCsvConverter(unittest.TestCase):
                 "names.csv should contain all name columns"
             )
 
+    def test_read_csv_matches_dict_reader(self):
+        """CSV files read into the same rows as csv.DictReader, including blank and ragged lines."""
+        csv_path = Path(self.temp_dir.name) / "budgets.csv"
+        csv_path.write_text(
+            'organisation_identifier,budget_type,value\n'
+            'XM-DAC-1,total-budget,100\n'
+            '\n'
+            'XM-DAC-2,total-budget\n'
+            'XM-DAC-3,total-budget,300,extra\n'
+            '"XM-DAC-4","multi\nline",400\n',
+            encoding='utf-8'
+        )
+
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            expected = list(csv.DictReader(f))
+
+        self.assertEqual(self.converter._read_budgets_csv(csv_path), expected)
+        self.assertEqual(self.converter._read_budgets_csv(Path(self.temp_dir.name) / "missing.csv"), [])
+
+    def test_read_csv_reuses_parse_until_file_changes(self):
+        """With cache_csv_reads, an unchanged CSV reuses its parse; rewritten content is parsed again."""
+        converter = IatiOrganisationMultiCsvConverter(cache_csv_reads=True)
+        csv_path = Path(self.temp_dir.name) / "names.csv"
+        csv_path.write_text('organisation_identifier,name\nXM-DAC-1,One\n', encoding='utf-8')
+        stat = csv_path.stat()
+
+        first = converter._read_names_csv(csv_path)
+        parsed = converter._csv_cache[str(csv_path)][1]
+        first[0]["name"] = "changed by caller"
+        self.assertEqual(converter._read_names_csv(csv_path), [{"organisation_identifier": "XM-DAC-1", "name": "One"}])
+        self.assertIs(converter._csv_cache[str(csv_path)][1], parsed)
+
+        # Same size and same modification time: only the content tells the files apart
+        csv_path.write_text('organisation_identifier,name\nXM-DAC-1,Two\n', encoding='utf-8')
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(converter._read_names_csv(csv_path), [{"organisation_identifier": "XM-DAC-1", "name": "Two"}])
+
+        # Converters do not cache unless asked to, and never share a cache
+        self.assertIsNone(self.converter._csv_cache)
+
+    def test_read_csv_interns_identifier_and_code_columns(self):
+        """Repeated identifiers and codes are shared strings; free-text columns are not interned."""
+        csv_path = Path(self.temp_dir.name) / "budgets.csv"
+        csv_path.write_text(
+            'organisation_identifier,budget_kind,value,currency\n'
+            'XM-DAC-1,total-budget,100,USD\n'
+            'XM-DAC-1,total-budget,200,USD\n',
+            encoding='utf-8'
+        )
+
+        first, second = self.converter._read_budgets_csv(csv_path)
+        for column in ("organisation_identifier", "budget_kind", "currency"):
+            self.assertIs(first[column], second[column])
+        self.assertIs(first["currency"], sys.intern("USD"))
+
+    def test_xml_to_csv_names_written_only_for_multilingual_names(self):
+        """names.csv holds every name, in document order, once any organisation has several names."""
+        def org(org_id, *names):
+            narratives = "".join(f'<narrative xml:lang="{lang}">{text}</narrative>' for lang, text in names)
+            return (
+                f'<iati-organisation><organisation-identifier>{org_id}</organisation-identifier>'
+                f'<name>{narratives}</name></iati-organisation>'
+            )
+
+        single = org("XM-1", ("en", "One")) + org("XM-2", ("en", "Two"))
+        self.test_xml_path.write_text(f'<iati-organisations version="2.03">{single}</iati-organisations>')
+        self.assertTrue(self.converter.xml_to_csv_folder(self.test_xml_path, self.csv_folder_path))
+        self.assertFalse((self.csv_folder_path / "names.csv").exists())
+        self.assertFalse((self.csv_folder_path / "budgets.csv").exists())
+
+        multi = single + org("XM-3", ("en", "Three"), ("fr", "Trois")) + org("XM-4", ("es", "Cuatro"))
+        self.test_xml_path.write_text(f'<iati-organisations version="2.03">{multi}</iati-organisations>')
+        self.assertTrue(self.converter.xml_to_csv_folder(self.test_xml_path, self.csv_folder_path))
+
+        with open(self.csv_folder_path / "organisations.csv", encoding="utf-8") as f:
+            self.assertEqual([row["organisation_identifier"] for row in csv.DictReader(f)], ["XM-1", "XM-2", "XM-3", "XM-4"])
+        with open(self.csv_folder_path / "names.csv", encoding="utf-8") as f:
+            self.assertEqual(
+                [(row["organisation_identifier"], row["language"], row["name"]) for row in csv.DictReader(f)],
+                [("XM-1", "en", "One"), ("XM-2", "en", "Two"), ("XM-3", "en", "Three"),
+                 ("XM-3", "fr", "Trois"), ("XM-4", "es", "Cuatro")]
+            )
+
+    def test_csv_folder_to_xml_warns_about_orphan_rows(self):
+        """Child rows for organisations missing from organisations.csv are dropped with one warning."""
+        self.csv_folder_path.mkdir()
+        (self.csv_folder_path / "organisations.csv").write_text(
+            "organisation_identifier,name\nXM-1,One\n", encoding="utf-8"
+        )
+        (self.csv_folder_path / "documents.csv").write_text(
+            "organisation_identifier,url,format,title\n"
+            "XM-1,https://example.org/a.pdf,application/pdf,A\n"
+            "XM-9,https://example.org/b.pdf,application/pdf,B\n"
+            "XM-9,https://example.org/c.pdf,application/pdf,C\n",
+            encoding="utf-8"
+        )
+
+        self.assertTrue(self.converter.csv_folder_to_xml(self.csv_folder_path, self.test_xml_path))
+
+        self.assertEqual(len(self.converter.latest_warnings), 1)
+        self.assertIn("Ignored 2 rows", self.converter.latest_warnings[0])
+        documents = ET.parse(self.test_xml_path).getroot().findall("iati-organisation/document-link")
+        self.assertEqual([doc.get("url") for doc in documents], ["https://example.org/a.pdf"])
+
+    @unittest.skipUnless(organisations_base.PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_xml_to_parquet_folder(self):
+        """Parquet output has the CSV columns, with typed money and date values."""
+        import datetime
+        import pyarrow.parquet as pq
+
+        self.test_xml_path.write_text(
+            '<iati-organisations version="2.03"><iati-organisation>'
+            '<organisation-identifier>XM-1</organisation-identifier><name><narrative>One</narrative></name>'
+            '<total-budget status="2"><period-start iso-date="2025-01-01"/><period-end iso-date="2025-12-31"/>'
+            '<value currency="USD" value-date="2025-01-01">1500.50</value></total-budget>'
+            '</iati-organisation></iati-organisations>'
+        )
+
+        self.assertTrue(self.converter.xml_to_parquet_folder(self.test_xml_path, self.csv_folder_path, batch_size=1))
+
+        self.assertEqual(
+            sorted(path.name for path in self.csv_folder_path.iterdir()),
+            ["budgets.parquet", "names.parquet", "organisations.parquet"]
+        )
+        budgets = pq.read_table(self.csv_folder_path / "budgets.parquet")
+        self.assertEqual(budgets.column_names, self.converter.csv_files["budgets"]["columns"])
+        row = budgets.to_pylist()[0]
+        self.assertEqual(row["value"], 1500.5)
+        self.assertEqual(row["period_start"], datetime.date(2025, 1, 1))
+        self.assertEqual(row["budget_kind"], "total-budget")
+
+    @unittest.skipUnless(organisations_base.PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_xml_to_parquet_folder_writes_null_for_bad_values(self):
+        """A malformed amount or date becomes null with a warning instead of failing the export."""
+        import pyarrow.parquet as pq
+
+        self.test_xml_path.write_text(
+            '<iati-organisations version="2.03"><iati-organisation>'
+            '<organisation-identifier>XM-1</organisation-identifier><name><narrative>One</narrative></name>'
+            '<total-budget status="2"><period-start iso-date="2025-01-01"/><period-end iso-date="end of year"/>'
+            '<value currency="USD" value-date="2025-01-01">$1,500</value></total-budget>'
+            '</iati-organisation></iati-organisations>'
+        )
+
+        self.assertTrue(self.converter.xml_to_parquet_folder(self.test_xml_path, self.csv_folder_path))
+
+        row = pq.read_table(self.csv_folder_path / "budgets.parquet").to_pylist()[0]
+        self.assertIsNone(row["value"])
+        self.assertIsNone(row["period_end"])
+        self.assertIsNotNone(row["period_start"])
+        self.assertEqual(len(self.converter.latest_warnings), 2)
+        self.assertIn("'$1,500'", self.converter.latest_warnings[0] + self.converter.latest_warnings[1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,14 +1,21 @@
+import io
 import unittest
 import tempfile
 from pathlib import Path
 import csv
 import xml.etree.ElementTree as ET
+from unittest import mock
 
 from okfn_iati.organisation_xml_generator import (
     IatiOrganisationCSVConverter,
     IatiOrganisationXMLGenerator,
+    OrganisationBudget,
+    OrganisationDocument,
+    OrganisationExpenditure,
     OrganisationRecord,
 )
+from okfn_iati.organisations import OrganisationBudgetLine
+from okfn_iati.organisations import base as organisations_base
 
 
 class TestOrganisationXMLGenerator(unittest.TestCase):
@@ -88,6 +95,33 @@ class TestOrganisationXMLGenerator(unittest.TestCase):
         expected_identifiers = ["XM-DAC-001", "XM-DAC-002", "XM-DAC-003"]
         self.assertEqual(sorted(identifiers), sorted(expected_identifiers))
 
+    def test_stream_folder_matches_convert_folder(self):
+        """Streaming a folder writes the same document as convert_folder_to_xml."""
+        csv_folder = Path(self.temp_dir.name) / "stream_folder"
+        csv_folder.mkdir()
+        for i in range(3):
+            self._create_test_csv(csv_folder / f"org{i}.csv", f"XM-DAC-00{i}", f"Organization {i}")
+
+        with mock.patch.object(organisations_base, "_utc_timestamp", return_value="2025-01-01T00:00:00Z"):
+            converted = self.converter.convert_folder_to_xml(csv_folder, Path(self.temp_dir.name) / "a.xml")
+            streamed = self.converter.stream_folder_to_xml(csv_folder, Path(self.temp_dir.name) / "b.xml")
+
+        self.assertEqual(Path(streamed).read_bytes(), Path(converted).read_bytes())
+
+    def test_generation_time_shared_by_organisations(self):
+        """A generation time passed to build_root_element is used for every organisation."""
+        root = self.generator.build_root_element(generation_time="2025-01-01T00:00:00Z")
+        self.generator.add_organisations(root, [
+            OrganisationRecord(org_identifier="XM-DAC-001", name="One"),
+            OrganisationRecord(org_identifier="XM-DAC-002", name="Two"),
+        ])
+
+        self.assertEqual(root.get("generated-datetime"), "2025-01-01T00:00:00Z")
+        self.assertEqual(
+            [org.get("last-updated-datetime") for org in root.findall("iati-organisation")],
+            ["2025-01-01T00:00:00Z", "2025-01-01T00:00:00Z"]
+        )
+
     def test_empty_folder_raises_error(self):
         """Test that an empty folder raises an appropriate error."""
         empty_folder = Path(self.temp_dir.name) / "empty"
@@ -272,6 +306,220 @@ class TestOrganisationXMLGenerator(unittest.TestCase):
         self.assertEqual(xml_lang_1, "en")
         self.assertEqual(xml_lang_2, "en")
 
+    def test_organisations_share_generated_datetime(self):
+        """Every organisation in a document is stamped with the root's generated-datetime."""
+        root = self.generator.build_root_element()
+        for org_id in ("XM-DAC-001", "XM-DAC-002"):
+            self.generator.add_organisation(root, OrganisationRecord(org_identifier=org_id, name=org_id))
+
+        generated = root.get("generated-datetime")
+        self.assertTrue(generated)
+        for org in root.findall("iati-organisation"):
+            self.assertEqual(org.get("last-updated-datetime"), generated)
+
+    def test_add_organisations_in_bulk(self):
+        """add_organisations appends one element per record, in order."""
+        root = self.generator.build_root_element()
+        records = [OrganisationRecord(org_identifier=f"XM-DAC-00{i}", name=f"Org {i}") for i in range(1, 4)]
+
+        elements = self.generator.add_organisations(root, records)
+
+        self.assertEqual(elements, root.findall("iati-organisation"))
+        self.assertEqual(
+            [el.findtext("organisation-identifier") for el in elements],
+            ["XM-DAC-001", "XM-DAC-002", "XM-DAC-003"]
+        )
+
+    @mock.patch.object(organisations_base, "_utc_timestamp", return_value="2025-01-01T00:00:00Z")
+    def test_parallel_save_matches_save_to_file(self, _timestamp):
+        """Serialising organisations in worker processes gives the same file as save_to_file."""
+        records = [
+            OrganisationRecord(
+                org_identifier=f"XM-DAC-{i:03d}", name=f"Organización {i}",
+                budgets=[OrganisationBudget(
+                    kind="total-budget", status="2", period_start="2024-01-01",
+                    period_end="2024-12-31", value=str(i * 1000), currency="EUR"
+                )]
+            )
+            for i in range(1, 8)
+        ]
+        parallel_file = Path(self.temp_dir.name) / "parallel.xml"
+
+        root = self.generator.build_root_element()
+        self.generator.add_organisations(root, records)
+        self.generator.save_to_file(root, self.xml_file)
+        self.generator.save_organisations_to_file(records, parallel_file, workers=2, chunk_size=3)
+
+        self.assertEqual(parallel_file.read_bytes(), self.xml_file.read_bytes())
+
+    def test_save_to_file_matches_to_string(self):
+        """Writing straight to disk produces the same document as to_string."""
+        root = self.generator.build_root_element()
+        self.generator.add_organisation(
+            root, OrganisationRecord(org_identifier="XM-DAC-001", name="Organización Uno & Co")
+        )
+
+        self.generator.save_to_file(root, self.xml_file)
+
+        self.assertEqual(self.xml_file.read_text(encoding="utf-8"), self.generator.to_string(root))
+
+    @unittest.skipUnless(organisations_base.OPENPYXL_AVAILABLE, "openpyxl not installed")
+    def test_read_from_xlsx_file(self):
+        """The first data row of an .xlsx file is read without pandas."""
+        from openpyxl import Workbook
+
+        xlsx_file = Path(self.temp_dir.name) / "test_org.xlsx"
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Organisation Identifier", "Name", "Reporting Org Type", "xml_lang"])
+        sheet.append([" XM-DAC-001 ", "Organization One", 40, None])
+        sheet.append(["XM-DAC-002", "Organization Two", 10, "fr"])
+        workbook.save(xlsx_file)
+
+        record = self.converter.read_from_file(xlsx_file)
+
+        self.assertEqual(record.org_identifier, "XM-DAC-001")
+        self.assertEqual(record.name, "Organization One")
+        self.assertEqual(record.reporting_org_type, "40")
+        self.assertEqual(record.xml_lang, "en")
+
+    def test_pandas_available_flag_kept(self):
+        """PANDAS_AVAILABLE is still a module attribute, telling whether pandas can be imported."""
+        from okfn_iati.organisations.base import PANDAS_AVAILABLE
+
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            self.assertFalse(PANDAS_AVAILABLE)
+        else:
+            self.assertTrue(PANDAS_AVAILABLE)
+        self.assertFalse(hasattr(organisations_base, "NOT_A_FLAG"))
+
+    def test_budget_and_expense_lines(self):
+        """Budget and expense lines, given as records or plain dicts, are kept as records but not written."""
+        record = OrganisationRecord(org_identifier="XM-DAC-001", name="Org")
+        record.budgets.append(OrganisationBudget(
+            kind="total-budget", period_start="2024-01-01", period_end="2024-12-31",
+            value="1000", currency="USD",
+            budget_lines=[{"ref": "1", "value": "600", "narrative": "Programmes", "note": "ignored"}]
+        ))
+        record.expenditures.append(OrganisationExpenditure(
+            period_start="2023-01-01", period_end="2023-12-31", value="900",
+            expense_lines=[OrganisationBudgetLine(ref="A", value="900", narrative="Staff", lang="es")]
+        ))
+        root = self.generator.build_root_element()
+        org = self.generator.add_organisation(root, record)
+
+        self.assertEqual(record.budgets[0].budget_lines, [OrganisationBudgetLine(ref="1", value="600", narrative="Programmes")])
+        self.assertEqual([child.tag for child in org.find("total-budget")], ["period-start", "period-end", "value"])
+        self.assertEqual([child.tag for child in org.find("total-expenditure")], ["period-start", "period-end", "value"])
+
+    def test_budget_line_dict_values_kept(self):
+        """Money values of budget lines given as dicts are kept exactly as given."""
+        budget = OrganisationBudget(
+            kind="total-budget",
+            budget_lines=[{"ref": "1", "value": " $1,500.00 "}, {"ref": "2", "value": "n/a"}, {"ref": "3"}]
+        )
+
+        self.assertEqual([line.value for line in budget.budget_lines], [" $1,500.00 ", "n/a", None])
+
+    def test_read_formatted_money_values(self):
+        """With clean_money_values, currency symbols and thousands separators are removed from money values."""
+        csv_file = Path(self.temp_dir.name) / "org_money.csv"
+        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["Organisation Identifier", "Name", "Budget Kind", "Budget Value", "Expenditure Value"])
+            writer.writerow(["XM-DAC-456", "Test Org", "total-budget", "$1,500,000.00", "1,5"])
+
+        record = self.converter.read_from_file(csv_file)
+        self.assertEqual(record.budgets[0].value, "$1,500,000.00")
+
+        record = IatiOrganisationCSVConverter(clean_money_values=True).read_from_file(csv_file)
+        self.assertEqual(record.budgets[0].value, "1500000.00")
+        # Not a thousands separator, left for the schema validator to report
+        self.assertEqual(record.expenditures[0].value, "1,5")
+
+    def test_generate_templates_in_batch(self):
+        """generate_templates writes the same file as generate_template for every path."""
+        output_files = [Path(self.temp_dir.name) / "batch" / f"template_{i}.csv" for i in range(4)]
+
+        self.converter.generate_templates(output_files, workers=2)
+
+        for output_file in output_files:
+            self.assertEqual(output_file.read_bytes(), self.csv_file.read_bytes())
+
+    def test_template_bytes_match_csv_writer(self):
+        """The pre-encoded template lines are what csv.writer would write for the same values."""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows([
+            organisations_base._TEMPLATE_COLUMNS, organisations_base._TEMPLATE_EXAMPLE_ROW
+        ])
+        expected = buffer.getvalue().encode("utf-8")
+
+        self.assertEqual(
+            organisations_base._TEMPLATE_HEADER_BYTES + organisations_base._TEMPLATE_EXAMPLE_BYTES, expected
+        )
+        self.assertEqual(self.csv_file.read_bytes(), expected)
+
+    def test_template_written_in_full_after_short_writes(self):
+        """generate_template keeps writing when os.write writes only part of the template."""
+        real_write = organisations_base.os.write
+        output_file = Path(self.temp_dir.name) / "short_writes.csv"
+
+        with mock.patch.object(organisations_base.os, "write", side_effect=lambda fd, data: real_write(fd, data[:7])):
+            self.converter.generate_template(output_file)
+
+        self.assertEqual(output_file.read_bytes(), self.csv_file.read_bytes())
+
+    def test_organisation_child_elements(self):
+        """Each child element is written once under its parent, in schema order and with its attributes."""
+        record = OrganisationRecord(
+            org_identifier="XM-DAC-001", name="Org",
+            reporting_org_ref="XM-DAC-001", reporting_org_type="40", reporting_org_name="Org"
+        )
+        record.budgets.append(OrganisationBudget(
+            kind="recipient-org-budget", status="2", period_start="2024-01-01", period_end="2024-12-31",
+            value="1000", currency="USD", recipient_org_ref="XM-R", recipient_org_name="Recipient"
+        ))
+        record.expenditures.append(OrganisationExpenditure(
+            period_start="2023-01-01", period_end="2023-12-31", value="900", currency="EUR"
+        ))
+        record.documents.append(OrganisationDocument(
+            url="https://example.org/r", title="Report", category_code="B01", language="en", document_date="2024-02-01"
+        ))
+        root = self.generator.build_root_element()
+        org = self.generator.add_organisation(root, record)
+
+        self.assertEqual(len(root), 1)
+        tree = org.getroottree()
+        self.assertEqual(
+            [(tree.getpath(el).replace("/iati-organisations/iati-organisation/", ""), dict(el.attrib), el.text)
+             for el in org.iterdescendants()],
+            [
+                ("organisation-identifier", {}, "XM-DAC-001"),
+                ("name", {}, None),
+                ("name/narrative", {}, "Org"),
+                ("reporting-org", {"ref": "XM-DAC-001", "type": "40"}, None),
+                ("reporting-org/narrative", {}, "Org"),
+                ("recipient-org-budget", {"status": "2"}, None),
+                ("recipient-org-budget/recipient-org", {"ref": "XM-R"}, None),
+                ("recipient-org-budget/recipient-org/narrative", {}, "Recipient"),
+                ("recipient-org-budget/period-start", {"iso-date": "2024-01-01"}, None),
+                ("recipient-org-budget/period-end", {"iso-date": "2024-12-31"}, None),
+                ("recipient-org-budget/value", {"currency": "USD", "value-date": "2024-01-01"}, "1000"),
+                ("total-expenditure", {}, None),
+                ("total-expenditure/period-start", {"iso-date": "2023-01-01"}, None),
+                ("total-expenditure/period-end", {"iso-date": "2023-12-31"}, None),
+                ("total-expenditure/value", {"currency": "EUR", "value-date": "2023-01-01"}, "900"),
+                ("document-link", {"url": "https://example.org/r", "format": "text/html"}, None),
+                ("document-link/title", {}, None),
+                ("document-link/title/narrative", {}, "Report"),
+                ("document-link/category", {"code": "B01"}, None),
+                ("document-link/language", {"code": "en"}, None),
+                ("document-link/document-date", {"iso-date": "2024-02-01"}, None),
+            ]
+        )
+
     def _create_test_csv(self, file_path: Path, org_id: str, org_name: str):
         """Helper method to create a test CSV file with basic organisation data."""
         with open(file_path, 'w', newline='', encoding='utf-8') as f: